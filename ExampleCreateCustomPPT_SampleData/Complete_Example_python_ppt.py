@@ -8,15 +8,30 @@ Works with or without a template!
 ============================================================================
 """
 
+import copy
+import hashlib
+import io
 import os
+import shutil
+import tempfile
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Emu, Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from xml.sax.saxutils import escape
 from datetime import datetime
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 print("=" * 80)
 print("CORPORATE QUARTERLY REPORT - POWERPOINT GENERATOR")
 print("=" * 80)
@@ -32,6 +47,7 @@ USE_TEMPLATE = os.path.exists(TEMPLATE_PATH)
 
 # Chart paths
 CHART_DIR = "/dbfs/FileStore/example_charts"
+CHART_MAX_PX = 1800  # Charts display 9" wide; wider images only add file size
 DATA_DIR = "/dbfs/FileStore/example_data"
 
 # Output path
@@ -57,19 +73,83 @@ class CorporateColors:
 
 colors = CorporateColors()
 
+# ============================================================================
+# LAYOUT CONSTANTS
+# ============================================================================
+
+class SlideGeometry:
+    """Fixed shape positions as (left, top, width, height) in EMU"""
+    TITLE_BAR = (Emu(0), Emu(0), Inches(10), Inches(0.8))
+    TITLE_TEXT = (Inches(0.3), Inches(0.15), Inches(9.4), Inches(0.5))
+    COVER_TITLE = (Inches(1), Inches(1.8), Inches(8), Inches(1))
+    COVER_SUBTITLE = (Inches(1), Inches(3), Inches(8), Inches(0.6))
+    CLOSING_TITLE = (Inches(1), Inches(2), Inches(8), Inches(1))
+    CLOSING_SUBTITLE = (Inches(1), Inches(3.2), Inches(8), Inches(0.5))
+    TABLE = (Inches(1), Inches(1.3), Inches(8), Inches(3.5))
+    
+    # Charts: (left, top, width) - height follows the image aspect ratio
+    CHART = (Inches(0.5), Inches(1.3), Inches(9))
+    CHART_FALLBACK = (Inches(0.5), Inches(1.5), Inches(9))
+    
+    # Metric cards: 2-column grid, shapes offset from each card's top-left
+    CARD_COLUMNS = (Inches(0.5), Inches(0.5 + 4.75))
+    CARD_TOP = Inches(1.3)
+    CARD_ROW_STEP = Inches(1.6)
+    CARD_SIZE = (Inches(4.25), Inches(1.3))
+    CARD_NAME = (Inches(0.2), Inches(0.15), Inches(4), Inches(0.3))
+    CARD_VALUE = (Inches(0.2), Inches(0.5), Inches(2.5), Inches(0.5))
+    CARD_CHANGE = (Inches(3), Inches(0.6), Inches(1), Inches(0.4))
+
+geometry = SlideGeometry()
+
+_PT2, _PT12, _PT14, _PT16 = Pt(2), Pt(12), Pt(14), Pt(16)
+_PT24, _PT28, _PT32, _PT36 = Pt(24), Pt(28), Pt(32), Pt(36)
+_PT54, _PT60 = Pt(54), Pt(60)
+
 # ============================================================================
 # LOAD DATA
 # ============================================================================
 
-print("1. Loading data from CSV files...")
+# Columns read by the slide builders - nothing else is materialized
+DATA_COLUMNS = {
+    "summary_metrics": ["Metric", "Value", "Unit", "Change"],
+    "monthly_sales": ["Month", "Revenue", "Target", "Expenses"],
+    "product_performance": ["Product", "Q3_Sales", "Q4_Sales", "Growth"],
+    "regional_sales": ["Region", "Sales", "Percentage"],
+    "customer_segments": ["Month", "Segment", "Revenue"],
+    "department_budget": ["Department", "Budget", "Actual"],
+}
+
+# Only these tables feed slides directly - the others are already charted by R.
+# Set LOAD_ALL = True to load every table into `data` for custom slides.
+SLIDE_TABLES = ("summary_metrics", "product_performance")
+LOAD_ALL = False
+
+def load_all(data_dir, tables=DATA_COLUMNS):
+    """Load all data tables, preferring Parquet and falling back to CSV"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        pq = None
+    available = set(os.listdir(data_dir))
+    
+    def load_one(name):
+        columns = tables[name]
+        if pq is not None and f"{name}.parquet" in available:
+            return pq.read_table(f"{data_dir}/{name}.parquet", columns=columns).to_pandas()
+        return pd.read_csv(f"{data_dir}/{name}.csv", usecols=columns)
+    
+    # File reads and Parquet decoding release the GIL, so tables load concurrently
+    with ThreadPoolExecutor(max_workers=len(tables)) as pool:
+        return dict(zip(tables, pool.map(load_one, tables)))
+
+print("1. Loading data files...")
 
 try:
-    summary_metrics = pd.read_csv(f"{DATA_DIR}/summary_metrics.csv")
-    monthly_sales = pd.read_csv(f"{DATA_DIR}/monthly_sales.csv")
-    product_performance = pd.read_csv(f"{DATA_DIR}/product_performance.csv")
-    regional_sales = pd.read_csv(f"{DATA_DIR}/regional_sales.csv")
-    customer_segments = pd.read_csv(f"{DATA_DIR}/customer_segments.csv")
-    department_budget = pd.read_csv(f"{DATA_DIR}/department_budget.csv")
+    tables = DATA_COLUMNS if LOAD_ALL else {name: DATA_COLUMNS[name] for name in SLIDE_TABLES}
+    data = load_all(DATA_DIR, tables)
+    summary_metrics = data["summary_metrics"]
+    product_performance = data["product_performance"]
     
     print("   ✓ All data files loaded successfully")
     print()
@@ -82,6 +162,130 @@ except Exception as e:
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Table cells are emitted as raw DrawingML sharing one style template,
+# instead of styling each cell through the python-pptx wrappers
+_PRIMARY_HEX = str(colors.PRIMARY)
+_WHITE_HEX = str(colors.WHITE)
+_BACKGROUND_HEX = str(colors.BACKGROUND)
+
+_CELL_XML = (
+    '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>'
+    '<a:p><a:pPr algn="ctr">{rpr}</a:pPr><a:r><a:t>{text}</a:t></a:r></a:p>'
+    '</a:txBody><a:tcPr><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></a:tcPr></a:tc>'
+)
+_HEADER_RPR = (
+    f'<a:defRPr b="1" sz="{_PT14.centipoints}">'
+    f'<a:solidFill><a:srgbClr val="{_WHITE_HEX}"/></a:solidFill></a:defRPr>'
+)
+_BODY_RPR = f'<a:defRPr sz="{_PT12.centipoints}"/>'
+
+_chart_cache = {}   # path -> prepared PNG bytes
+_image_blobs = {}   # (source content hash, target_px) -> prepared PNG bytes
+
+def _prepare_chart(path, target_px=CHART_MAX_PX):
+    """Return a chart PNG as a stream, downscaled to target_px wide if larger
+    
+    Identical source images map to the same output bytes, so python-pptx
+    stores them as a single image part however many slides use them.
+    """
+    blob = _chart_cache.get(path)
+    if blob is None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        content_key = (hashlib.blake2b(raw, digest_size=16).digest(), target_px)
+        blob = _image_blobs.get(content_key)
+        if blob is None:
+            blob = raw
+            if Image is not None:
+                img = Image.open(io.BytesIO(raw))
+                if img.width > target_px:
+                    # Fixed encoder settings and no text chunks keep the output deterministic
+                    img.thumbnail((target_px, target_px * 2), Image.LANCZOS)
+                    buf = io.BytesIO()
+                    img.save(buf, format='PNG', compress_level=6, pnginfo=None)
+                    blob = buf.getvalue()
+            _image_blobs[content_key] = blob
+        _chart_cache[path] = blob
+    return io.BytesIO(blob)
+
+def _add_chart_picture(slide, chart_image, chart_path, left, top, width=None, height=None):
+    """add_picture() from a prepared stream, keeping the chart file name as alt text"""
+    pic = slide.shapes.add_picture(chart_image, left, top, width, height)
+    pic._element.nvPicPr.cNvPr.set('descr', os.path.basename(chart_path))
+    return pic
+
+def _xfrm_xml(left, top, width, height):
+    """DrawingML position/size element for raw EMU values"""
+    return f'<a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+
+# Filled rectangle, equivalent to add_shape(1, ...) + fill/line setters but
+# without going through the python-pptx shape factory
+_RECT_XML = (
+    '<p:sp ' + nsdecls("a", "p") + '>'
+    '<p:nvSpPr><p:cNvPr id="{id}" name="{name}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>{xfrm}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>{line}</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+    '</p:sp>'
+)
+
+def _rect_sp(shape_id, left, top, width, height, fill_hex, line_hex=None,
+             line_width=_PT2, name=None):
+    """Parse a rectangle <p:sp>; no outline unless line_hex is given"""
+    if line_hex is None:
+        line = '<a:ln><a:noFill/></a:ln>'
+    else:
+        line = f'<a:ln w="{line_width}"><a:solidFill><a:srgbClr val="{line_hex}"/></a:solidFill></a:ln>'
+    return parse_xml(_RECT_XML.format(
+        id=shape_id, name=name or f"Rectangle {shape_id - 1}",
+        xfrm=_xfrm_xml(left, top, width, height), fill=fill_hex, line=line,
+    ))
+
+def _add_rect(sp_tree, shape_id, left, top, width, height, fill_hex, line_hex=None):
+    """Append a filled rectangle with the given shape id to a slide's shape tree"""
+    sp_tree.insert_element_before(
+        _rect_sp(shape_id, left, top, width, height, fill_hex, line_hex), 'p:extLst'
+    )
+
+# Title bar (filled rectangle + title text box) shared by the content slides,
+# parsed once and cloned onto each slide
+_TITLE_BAR_SP = _rect_sp(0, *geometry.TITLE_BAR, _PRIMARY_HEX, name="Title Bar")
+_TITLE_TEXT_SP = parse_xml(
+    f'<p:sp {nsdecls("a", "p")}>'
+    '<p:nvSpPr><p:cNvPr id="0" name="Title"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    f'<p:spPr>{_xfrm_xml(*geometry.TITLE_TEXT)}'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    f'<a:p><a:pPr algn="l"><a:defRPr sz="{_PT32.centipoints}" b="1">'
+    f'<a:solidFill><a:srgbClr val="{_WHITE_HEX}"/></a:solidFill></a:defRPr></a:pPr>'
+    '<a:r><a:t></a:t></a:r></a:p></p:txBody>'
+    '</p:sp>'
+)
+
+def _apply_title_bar(slide, text):
+    """Add the standard title bar with text, cloned from the prebuilt XML"""
+    sp_tree = slide.shapes._spTree
+    shape_id = slide.shapes._next_shape_id
+    bar = copy.deepcopy(_TITLE_BAR_SP)
+    bar.nvSpPr.cNvPr.id = shape_id
+    title = copy.deepcopy(_TITLE_TEXT_SP)
+    title.nvSpPr.cNvPr.id = shape_id + 1
+    title.find('.//' + qn('a:t')).text = text
+    sp_tree.insert_element_before(bar, 'p:extLst')
+    sp_tree.insert_element_before(title, 'p:extLst')
+
+def _replace_table_row(tr, texts, fill_hex, rpr):
+    """Swap a table row for pre-styled cells, parsed in a single call"""
+    cells = "".join(
+        _CELL_XML.format(rpr=rpr, text=escape(str(text)), fill=fill_hex) for text in texts
+    )
+    new_tr = parse_xml(f'<a:tr {nsdecls("a")} h="{tr.get("h")}">{cells}</a:tr>')
+    tr.getparent().replace(tr, new_tr)
+
 def add_title_slide(prs, title, subtitle):
     """Create a title slide"""
     slide = prs.slides.add_slide(prs.slide_layouts[0] if USE_TEMPLATE else prs.slide_layouts[6])
@@ -95,21 +299,21 @@ def add_title_slide(prs, title, subtitle):
         fill.fore_color.rgb = colors.PRIMARY
         
         # Main title
-        title_box = slide.shapes.add_textbox(Inches(1), Inches(1.8), Inches(8), Inches(1))
+        title_box = slide.shapes.add_textbox(*geometry.COVER_TITLE)
         title_frame = title_box.text_frame
         title_frame.text = title
         p = title_frame.paragraphs[0]
-        p.font.size = Pt(54)
+        p.font.size = _PT54
         p.font.bold = True
         p.font.color.rgb = colors.WHITE
         p.alignment = PP_ALIGN.CENTER
         
         # Subtitle
-        subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(8), Inches(0.6))
+        subtitle_box = slide.shapes.add_textbox(*geometry.COVER_SUBTITLE)
         subtitle_frame = subtitle_box.text_frame
         subtitle_frame.text = subtitle
         p = subtitle_frame.paragraphs[0]
-        p.font.size = Pt(24)
+        p.font.size = _PT24
         p.font.color.rgb = colors.SECONDARY
         p.alignment = PP_ALIGN.CENTER
     else:
@@ -123,40 +327,34 @@ def add_title_slide(prs, title, subtitle):
     
     return slide
 
-def add_content_slide_with_chart(prs, title, chart_path, layout_idx=1):
-    """Add a slide with title and chart"""
+def add_content_slide_with_chart(prs, title, chart_path, layout_idx=1, chart_files=None,
+                                 chart_image=None):
+    """Add a slide with title and chart
+    
+    chart_files: file names already listed from the chart directory; when
+    omitted, the chart is checked with os.path.exists instead.
+    chart_image: stream already returned by _prepare_chart(chart_path), if
+    the chart was prepared ahead of time.
+    """
+    
+    if chart_files is None:
+        chart_exists = os.path.exists(chart_path)
+    else:
+        chart_exists = os.path.basename(chart_path) in chart_files
+    if chart_exists and chart_image is None:
+        chart_image = _prepare_chart(chart_path)
     
     slide = prs.slides.add_slide(prs.slide_layouts[layout_idx] if USE_TEMPLATE else prs.slide_layouts[6])
     
     if not USE_TEMPLATE:
         # Create from scratch
-        # Title bar
-        title_bar = slide.shapes.add_shape(
-            1,  # Rectangle
-            Inches(0), Inches(0), Inches(10), Inches(0.8)
-        )
-        title_bar.fill.solid()
-        title_bar.fill.fore_color.rgb = colors.PRIMARY
-        title_bar.line.fill.background()
-        
-        # Title text
-        title_box = slide.shapes.add_textbox(Inches(0.3), Inches(0.15), Inches(9.4), Inches(0.5))
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        p = title_frame.paragraphs[0]
-        p.font.size = Pt(32)
-        p.font.bold = True
-        p.font.color.rgb = colors.WHITE
-        p.alignment = PP_ALIGN.LEFT
+        # Title bar and title text
+        _apply_title_bar(slide, title)
         
         # Chart
-        if os.path.exists(chart_path):
-            slide.shapes.add_picture(
-                chart_path,
-                Inches(0.5),   # left
-                Inches(1.3),   # top (below title)
-                width=Inches(9)  # width
-            )
+        if chart_exists:
+            # 0.5" from left, 1.3" from top (below title), 9" wide
+            _add_chart_picture(slide, chart_image, chart_path, *geometry.CHART)
             print(f"   ✓ Chart added: {title}")
         else:
             print(f"   ✗ Chart not found: {chart_path}")
@@ -168,26 +366,26 @@ def add_content_slide_with_chart(prs, title, chart_path, layout_idx=1):
             # Find content placeholder and replace with chart
             if len(slide.placeholders) > 1:
                 content_ph = slide.placeholders[1]
-                left = content_ph.left.inches if content_ph.left > 0 else 0.5
-                top = content_ph.top.inches if content_ph.top > 0 else 1.5
-                width = content_ph.width.inches
+                left = content_ph.left if content_ph.left > 0 else geometry.CHART_FALLBACK[0]
+                top = content_ph.top if content_ph.top > 0 else geometry.CHART_FALLBACK[1]
+                width = content_ph.width
                 
                 # Remove placeholder
                 sp = content_ph.element
                 sp.getparent().remove(sp)
                 
                 # Add chart
-                if os.path.exists(chart_path):
-                    slide.shapes.add_picture(chart_path, Inches(left), Inches(top), width=Inches(width))
+                if chart_exists:
+                    _add_chart_picture(slide, chart_image, chart_path, left, top, width=width)
                     print(f"   ✓ Chart added: {title}")
             else:
                 # Fallback positioning
-                if os.path.exists(chart_path):
-                    slide.shapes.add_picture(chart_path, Inches(0.5), Inches(1.5), width=Inches(9))
+                if chart_exists:
+                    _add_chart_picture(slide, chart_image, chart_path, *geometry.CHART_FALLBACK)
         except Exception as e:
             print(f"   ⚠ Using fallback positioning: {e}")
-            if os.path.exists(chart_path):
-                slide.shapes.add_picture(chart_path, Inches(0.5), Inches(1.5), width=Inches(9))
+            if chart_exists:
+                _add_chart_picture(slide, chart_image, chart_path, *geometry.CHART_FALLBACK)
     
     return slide
 
@@ -196,76 +394,71 @@ def add_metrics_slide(prs, title, metrics_df):
     
     slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
     
-    # Title bar
-    title_bar = slide.shapes.add_shape(
-        1,  # Rectangle
-        Inches(0), Inches(0), Inches(10), Inches(0.8)
-    )
-    title_bar.fill.solid()
-    title_bar.fill.fore_color.rgb = colors.PRIMARY
-    title_bar.line.fill.background()
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.3), Inches(0.15), Inches(9.4), Inches(0.5))
-    title_frame = title_box.text_frame
-    title_frame.text = title
-    p = title_frame.paragraphs[0]
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = colors.WHITE
+    # Title bar and title text
+    _apply_title_bar(slide, title)
     
     # Metric cards (2x2 grid)
-    for idx, (_, metric) in enumerate(metrics_df.iterrows()):
+    card_width, card_height = geometry.CARD_SIZE
+    name_dx, name_dy, name_width, name_height = geometry.CARD_NAME
+    value_dx, value_dy, value_width, value_height = geometry.CARD_VALUE
+    change_dx, change_dy, change_width, change_height = geometry.CARD_CHANGE
+    PRIMARY, DARK = colors.PRIMARY, colors.DARK_TEXT
+    ACCENT2, ACCENT3 = colors.ACCENT2, colors.ACCENT3
+    
+    # Each card is a rectangle followed by three text boxes; add_textbox
+    # numbers itself from the highest id, so cards advance the id by 4
+    sp_tree = slide.shapes._spTree
+    shape_id = slide.shapes._next_shape_id
+    
+    metrics = metrics_df[['Metric', 'Value', 'Unit', 'Change']].to_numpy()
+    
+    for idx in range(len(metrics)):
+        name, value, unit, change = metrics[idx]
         col = idx % 2
         row = idx // 2
         
-        left = 0.5 + (col * 4.75)
-        top = 1.3 + (row * 1.6)
+        left = geometry.CARD_COLUMNS[col]
+        top = geometry.CARD_TOP + row * geometry.CARD_ROW_STEP
         
         # Card background
-        card = slide.shapes.add_shape(
-            1,  # Rectangle
-            Inches(left), Inches(top), Inches(4.25), Inches(1.3)
-        )
-        card.fill.solid()
-        card.fill.fore_color.rgb = colors.BACKGROUND
-        card.line.color.rgb = colors.PRIMARY
-        card.line.width = Pt(2)
+        _add_rect(sp_tree, shape_id, left, top, card_width, card_height,
+                  _BACKGROUND_HEX, line_hex=_PRIMARY_HEX)
+        shape_id += 4
         
         # Metric name
         name_box = slide.shapes.add_textbox(
-            Inches(left + 0.2), Inches(top + 0.15),
-            Inches(4), Inches(0.3)
+            left + name_dx, top + name_dy,
+            name_width, name_height
         )
-        name_box.text = metric['Metric']
+        name_box.text = name
         p = name_box.text_frame.paragraphs[0]
-        p.font.size = Pt(14)
+        p.font.size = _PT14
         p.font.bold = True
-        p.font.color.rgb = colors.DARK_TEXT
+        p.font.color.rgb = DARK
         
         # Value
-        value_text = f"${metric['Value']}{metric['Unit']}" if metric['Unit'] in ['M', 'K'] else f"{metric['Value']}{metric['Unit']}"
+        value_text = f"${value}{unit}" if unit in ['M', 'K'] else f"{value}{unit}"
         value_box = slide.shapes.add_textbox(
-            Inches(left + 0.2), Inches(top + 0.5),
-            Inches(2.5), Inches(0.5)
+            left + value_dx, top + value_dy,
+            value_width, value_height
         )
         value_box.text = value_text
         p = value_box.text_frame.paragraphs[0]
-        p.font.size = Pt(36)
+        p.font.size = _PT36
         p.font.bold = True
-        p.font.color.rgb = colors.PRIMARY
+        p.font.color.rgb = PRIMARY
         
         # Change indicator
-        change_text = f"▲ {metric['Change']}%" if metric['Change'] > 0 else f"▼ {abs(metric['Change'])}%"
+        change_text = f"▲ {change}%" if change > 0 else f"▼ {abs(change)}%"
         change_box = slide.shapes.add_textbox(
-            Inches(left + 3), Inches(top + 0.6),
-            Inches(1), Inches(0.4)
+            left + change_dx, top + change_dy,
+            change_width, change_height
         )
         change_box.text = change_text
         p = change_box.text_frame.paragraphs[0]
-        p.font.size = Pt(16)
+        p.font.size = _PT16
         p.font.bold = True
-        p.font.color.rgb = colors.ACCENT2 if metric['Change'] > 0 else colors.ACCENT3
+        p.font.color.rgb = ACCENT2 if change > 0 else ACCENT3
         p.alignment = PP_ALIGN.RIGHT
     
     print(f"   ✓ Metrics slide created")
@@ -276,68 +469,34 @@ def add_table_slide(prs, title, df, columns_to_show):
     
     slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
     
-    # Title bar
-    title_bar = slide.shapes.add_shape(1, Inches(0), Inches(0), Inches(10), Inches(0.8))
-    title_bar.fill.solid()
-    title_bar.fill.fore_color.rgb = colors.PRIMARY
-    title_bar.line.fill.background()
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.3), Inches(0.15), Inches(9.4), Inches(0.5))
-    title_frame = title_box.text_frame
-    title_frame.text = title
-    p = title_frame.paragraphs[0]
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = colors.WHITE
+    # Title bar and title text
+    _apply_title_bar(slide, title)
     
     # Table
     rows = len(df) + 1  # +1 for header
     cols = len(columns_to_show)
     
-    table_shape = slide.shapes.add_table(
-        rows, cols,
-        Inches(1), Inches(1.3),
-        Inches(8), Inches(3.5)
-    )
-    table = table_shape.table
+    table_shape = slide.shapes.add_table(rows, cols, *geometry.TABLE)
+    tr_lst = table_shape.table._tbl.tr_lst
     
     # Header row
-    for col_idx, col_name in enumerate(columns_to_show):
-        cell = table.cell(0, col_idx)
-        cell.text = col_name
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = colors.PRIMARY
-        
-        for paragraph in cell.text_frame.paragraphs:
-            paragraph.font.bold = True
-            paragraph.font.size = Pt(14)
-            paragraph.font.color.rgb = colors.WHITE
-            paragraph.alignment = PP_ALIGN.CENTER
-    
-    # Data rows
-    for row_idx, (_, row) in enumerate(df.iterrows(), start=1):
-        for col_idx, col_name in enumerate(columns_to_show):
-            cell = table.cell(row_idx, col_idx)
-            
-            # Format value
-            value = row[col_name]
-            if isinstance(value, float):
-                if value > 100:
-                    cell.text = f"${value:.1f}M"
-                else:
-                    cell.text = f"{value:.1f}"
-            else:
-                cell.text = str(value)
-            
-            # Styling
-            bg_color = colors.WHITE if row_idx % 2 == 1 else colors.BACKGROUND
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = bg_color
-            
-            for paragraph in cell.text_frame.paragraphs:
-                paragraph.font.size = Pt(12)
-                paragraph.alignment = PP_ALIGN.CENTER
+    _replace_table_row(tr_lst[0], columns_to_show, _PRIMARY_HEX, _HEADER_RPR)
+    
+    # Format values column-at-a-time before building any rows
+    formatted = []
+    for col_name in columns_to_show:
+        values = df[col_name].to_numpy()
+        if values.dtype.kind == 'f':
+            formatted.append(np.where(values > 100,
+                                      np.char.mod("$%.1fM", values),
+                                      np.char.mod("%.1f", values)))
+        else:
+            formatted.append(df[col_name].astype(str).to_numpy())
+    
+    # Data rows (alternating background)
+    for row_idx, texts in enumerate(zip(*formatted), start=1):
+        bg_hex = _WHITE_HEX if row_idx % 2 == 1 else _BACKGROUND_HEX
+        _replace_table_row(tr_lst[row_idx], texts, bg_hex, _BODY_RPR)
     
     print(f"   ✓ Table slide created: {title}")
     return slide
@@ -353,19 +512,19 @@ def add_closing_slide(prs):
     fill.fore_color.rgb = colors.PRIMARY
     
     # Thank you text
-    thank_you = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1))
+    thank_you = slide.shapes.add_textbox(*geometry.CLOSING_TITLE)
     thank_you.text = "THANK YOU"
     p = thank_you.text_frame.paragraphs[0]
-    p.font.size = Pt(60)
+    p.font.size = _PT60
     p.font.bold = True
     p.font.color.rgb = colors.WHITE
     p.alignment = PP_ALIGN.CENTER
     
     # Questions text
-    questions = slide.shapes.add_textbox(Inches(1), Inches(3.2), Inches(8), Inches(0.5))
+    questions = slide.shapes.add_textbox(*geometry.CLOSING_SUBTITLE)
     questions.text = "Questions & Discussion"
     p = questions.text_frame.paragraphs[0]
-    p.font.size = Pt(28)
+    p.font.size = _PT28
     p.font.italic = True
     p.font.color.rgb = colors.SECONDARY
     p.alignment = PP_ALIGN.CENTER
@@ -388,10 +547,35 @@ else:
     prs.slide_height = Inches(5.625)
     print("   ✓ Creating presentation without template (blank slides)")
 
+# List the chart directory once - every stat on the DBFS mount is a round-trip
+try:
+    chart_files = {entry.name for entry in os.scandir(CHART_DIR)}
+except FileNotFoundError:
+    chart_files = set()
+
 print()
 print("3. Adding slides...")
 print()
 
+# Chart slides (slides 3-8): title and R chart file
+chart_slides = [
+    ("REVENUE PERFORMANCE", f"{CHART_DIR}/01_revenue_trend.png"),
+    ("PRODUCT PERFORMANCE", f"{CHART_DIR}/02_product_performance.png"),
+    ("REGIONAL DISTRIBUTION", f"{CHART_DIR}/03_regional_distribution.png"),
+    ("CUSTOMER SEGMENTS", f"{CHART_DIR}/04_customer_segments.png"),
+    ("DEPARTMENT BUDGET", f"{CHART_DIR}/05_department_budget.png"),
+    ("PRODUCT GROWTH RATES", f"{CHART_DIR}/06_growth_rates.png"),
+]
+
+# Read and resize the chart images in the background (file reads and Pillow
+# release the GIL) while the first slides are being built
+chart_pool = ThreadPoolExecutor(max_workers=4)
+chart_futures = [
+    chart_pool.submit(_prepare_chart, chart_path)
+    if os.path.basename(chart_path) in chart_files else None
+    for _, chart_path in chart_slides
+]
+
 # Slide 1: Title Slide
 add_title_slide(
     prs,
@@ -408,47 +592,16 @@ add_metrics_slide(
 )
 print("   ✓ Slide 2: Executive summary with metrics")
 
-# Slide 3: Revenue Trend
-add_content_slide_with_chart(
-    prs,
-    "REVENUE PERFORMANCE",
-    f"{CHART_DIR}/01_revenue_trend.png"
-)
-
-# Slide 4: Product Performance
-add_content_slide_with_chart(
-    prs,
-    "PRODUCT PERFORMANCE",
-    f"{CHART_DIR}/02_product_performance.png"
-)
-
-# Slide 5: Regional Distribution
-add_content_slide_with_chart(
-    prs,
-    "REGIONAL DISTRIBUTION",
-    f"{CHART_DIR}/03_regional_distribution.png"
-)
-
-# Slide 6: Customer Segments
-add_content_slide_with_chart(
-    prs,
-    "CUSTOMER SEGMENTS",
-    f"{CHART_DIR}/04_customer_segments.png"
-)
-
-# Slide 7: Department Budget
-add_content_slide_with_chart(
-    prs,
-    "DEPARTMENT BUDGET",
-    f"{CHART_DIR}/05_department_budget.png"
-)
-
-# Slide 8: Growth Rates
-add_content_slide_with_chart(
-    prs,
-    "PRODUCT GROWTH RATES",
-    f"{CHART_DIR}/06_growth_rates.png"
-)
+# Slides 3-8: Revenue, products, regions, segments, budget, growth
+for (title, chart_path), future in zip(chart_slides, chart_futures):
+    add_content_slide_with_chart(
+        prs,
+        title,
+        chart_path,
+        chart_files=chart_files,
+        chart_image=future.result() if future is not None else None
+    )
+chart_pool.shutdown()
 
 # Slide 9: Product Performance Table
 add_table_slide(
@@ -470,7 +623,17 @@ print()
 print("4. Saving presentation...")
 
 output_path = f"{OUTPUT_DIR}/Q4_2024_Business_Report.pptx"
-prs.save(output_path)
+
+# Write the zip to local disk, then copy it to DBFS in one pass -
+# saving straight through the FUSE mount issues many small writes
+tf = tempfile.NamedTemporaryFile(suffix=".pptx", delete=False)
+try:
+    with tf:
+        prs.save(tf)
+    file_size = os.path.getsize(tf.name)
+    shutil.copyfile(tf.name, output_path)
+finally:
+    os.remove(tf.name)
 
 print(f"   ✓ Presentation saved: {output_path}")
 print()
@@ -486,7 +649,7 @@ print()
 print("✅ Presentation Details:")
 print(f"   - Total Slides: 10")
 print(f"   - Template Used: {'Yes' if USE_TEMPLATE else 'No (created from scratch)'}")
-print(f"   - File Size: {os.path.getsize(output_path) / 1024:.1f} KB")
+print(f"   - File Size: {file_size / 1024:.1f} KB")
 print()
 print("📊 Content Summary:")
 print("   - 1 Title slide")
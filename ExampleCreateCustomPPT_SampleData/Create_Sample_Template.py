@@ -49,21 +49,19 @@ p.alignment = PP_ALIGN.CENTER
 # Title
 try:
     slide.placeholders[0].text = "YOUR COMPANY NAME"
-    title_frame = slide.placeholders[0].text_frame
-    for paragraph in title_frame.paragraphs:
-        paragraph.font.size = Pt(54)
-        paragraph.font.bold = True
-        paragraph.font.color.rgb = RGBColor(255, 255, 255)
+    p = slide.placeholders[0].text_frame.paragraphs[0]  # Setting .text leaves one paragraph
+    p.font.size = Pt(54)
+    p.font.bold = True
+    p.font.color.rgb = RGBColor(255, 255, 255)
 except:
     pass
 
 # Subtitle
 try:
     slide.placeholders[1].text = "Presentation Title | Date"
-    subtitle_frame = slide.placeholders[1].text_frame
-    for paragraph in subtitle_frame.paragraphs:
-        paragraph.font.size = Pt(24)
-        paragraph.font.color.rgb = SECONDARY_COLOR
+    p = slide.placeholders[1].text_frame.paragraphs[0]
+    p.font.size = Pt(24)
+    p.font.color.rgb = SECONDARY_COLOR
 except:
     pass
 
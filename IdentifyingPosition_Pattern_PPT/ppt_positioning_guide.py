@@ -14,9 +14,57 @@ import pandas as pd
 from pptx import Presentation
 from pptx.util import Inches, Pt, Cm
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+import inspect
+import itertools
 import os
+import sys
+import zipfile
+from contextlib import contextmanager
+from io import BytesIO
+
+EMU_PER_INCH = 914400
+_PT24 = Pt(24)
+
+# Embedded charts are PNG/JPEG, which are already deflate-compressed, but python-pptx
+# re-deflates every part on save. Inside stored_images(), images are written as-is
+# and XML uses a fast level; python-pptx's own writer is restored afterwards.
+try:
+    from pptx.opc.serialized import _ZipPkgWriter
+except ImportError:  # Private class; older python-pptx releases lay this out differently
+    _ZipPkgWriter = None
+
+# _zip_write relies on the writer's private _zipf and on write(pack_uri, blob);
+# on any other layout leave python-pptx's writer alone and save normally
+_CAN_STORE_IMAGES = (
+    _ZipPkgWriter is not None
+    and hasattr(_ZipPkgWriter, "_zipf")
+    and list(inspect.signature(_ZipPkgWriter.write).parameters) == ["self", "pack_uri", "blob"]
+)
+
+_STORED_EXTS = frozenset(("png", "jpg", "jpeg"))
+
+def _zip_write(self, pack_uri, blob):
+    """Write one package part, skipping recompression of images"""
+    if pack_uri.ext.lower() in _STORED_EXTS:
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+    else:
+        self._zipf.writestr(pack_uri.membername, blob, compresslevel=1)
+
+@contextmanager
+def stored_images():
+    """Use _zip_write for saves inside the block (plain save when it cannot be installed)"""
+    if not _CAN_STORE_IMAGES:
+        yield
+        return
+    original = _ZipPkgWriter.write
+    _ZipPkgWriter.write = _zip_write
+    try:
+        yield
+    finally:
+        _ZipPkgWriter.write = original
 
 print("=" * 80)
 print("POWERPOINT POSITIONING DIAGNOSTIC TOOL")
@@ -27,7 +75,7 @@ print()
 # STEP 1: ANALYZE YOUR TEMPLATE
 # ============================================================================
 
-def analyze_template(template_path):
+def analyze_template(prs, template_path):
     """
     Comprehensive template analysis showing:
     - All layouts and their names
@@ -35,75 +83,76 @@ def analyze_template(template_path):
     - Exact coordinates for each element
     """
     
-    if not os.path.exists(template_path):
-        print(f"❌ Template not found: {template_path}")
-        return
-    
-    prs = Presentation(template_path)
-    print(f"✅ Template loaded: {template_path}")
-    print(f"   Slide size: {prs.slide_width.inches:.2f}\" × {prs.slide_height.inches:.2f}\"")
-    print()
+    # Collect the report and write it once at the end
+    out = []
+    out.append(f"✅ Template loaded: {template_path}")
+    out.append(f"   Slide size: {prs.slide_width / EMU_PER_INCH:.2f}\" × {prs.slide_height / EMU_PER_INCH:.2f}\"")
+    out.append("")
     
     # Analyze each layout
     for layout_idx, layout in enumerate(prs.slide_layouts):
-        print("=" * 80)
-        print(f"LAYOUT {layout_idx}: {layout.name}")
-        print("=" * 80)
+        out.append("=" * 80)
+        out.append(f"LAYOUT {layout_idx}: {layout.name}")
+        out.append("=" * 80)
         
         if len(layout.placeholders) == 0:
-            print("   ⚠ No placeholders (blank layout)")
-            print()
+            out.append("   ⚠ No placeholders (blank layout)")
+            out.append("")
             continue
         
         # Show each placeholder
         for ph_idx, placeholder in enumerate(layout.placeholders):
-            print(f"\n📍 Placeholder [{ph_idx}]: {placeholder.name}")
-            print(f"   Type: {placeholder.placeholder_format.type}")
+            out.append(f"\n📍 Placeholder [{ph_idx}]: {placeholder.name}")
+            out.append(f"   Type: {placeholder.placeholder_format.type}")
             
-            # Position information
-            left_inches = placeholder.left.inches if placeholder.left > 0 else 0
-            top_inches = placeholder.top.inches if placeholder.top > 0 else 0
-            width_inches = placeholder.width.inches
-            height_inches = placeholder.height.inches
+            # Position information (read each EMU value once)
+            l, t, w, h = placeholder.left, placeholder.top, placeholder.width, placeholder.height
+            left_inches = l / EMU_PER_INCH if l > 0 else 0
+            top_inches = t / EMU_PER_INCH if t > 0 else 0
+            width_inches = w / EMU_PER_INCH
+            height_inches = h / EMU_PER_INCH
             
-            print(f"   Position (inches):")
-            print(f"      Left:   {left_inches:.2f}\"")
-            print(f"      Top:    {top_inches:.2f}\"")
-            print(f"      Width:  {width_inches:.2f}\"")
-            print(f"      Height: {height_inches:.2f}\"")
+            out.append(f"   Position (inches):")
+            out.append(f"      Left:   {left_inches:.2f}\"")
+            out.append(f"      Top:    {top_inches:.2f}\"")
+            out.append(f"      Width:  {width_inches:.2f}\"")
+            out.append(f"      Height: {height_inches:.2f}\"")
             
             # Calculate right and bottom edges
             right = left_inches + width_inches
             bottom = top_inches + height_inches
-            print(f"   Boundaries:")
-            print(f"      Right edge:  {right:.2f}\"")
-            print(f"      Bottom edge: {bottom:.2f}\"")
+            out.append(f"   Boundaries:")
+            out.append(f"      Right edge:  {right:.2f}\"")
+            out.append(f"      Bottom edge: {bottom:.2f}\"")
             
             # Show safe area for content
-            print(f"   💡 Safe area for images (inside this placeholder):")
-            print(f"      add_image_to_slide(slide, chart_path,")
-            print(f"                        left={left_inches:.2f}, top={top_inches:.2f},")
-            print(f"                        width={width_inches:.2f}, height={height_inches:.2f})")
+            out.append(f"   💡 Safe area for images (inside this placeholder):")
+            out.append(f"      add_image_to_slide(slide, chart_path,")
+            out.append(f"                        left={left_inches:.2f}, top={top_inches:.2f},")
+            out.append(f"                        width={width_inches:.2f}, height={height_inches:.2f})")
         
-        print()
+        out.append("")
     
     # Analyze actual slide if template has examples
     if len(prs.slides) > 0:
-        print("=" * 80)
-        print("EXAMPLE SLIDE ANALYSIS (First slide in template)")
-        print("=" * 80)
+        out.append("=" * 80)
+        out.append("EXAMPLE SLIDE ANALYSIS (First slide in template)")
+        out.append("=" * 80)
         slide = prs.slides[0]
         
         for idx, shape in enumerate(slide.shapes):
-            print(f"\nShape {idx}: {shape.name}")
-            print(f"   Type: {shape.shape_type}")
+            out.append(f"\nShape {idx}: {shape.name}")
+            out.append(f"   Type: {shape.shape_type}")
             
             if hasattr(shape, 'left'):
-                print(f"   Position:")
-                print(f"      Left:   {shape.left.inches:.2f}\"")
-                print(f"      Top:    {shape.top.inches:.2f}\"")
-                print(f"      Width:  {shape.width.inches:.2f}\"")
-                print(f"      Height: {shape.height.inches:.2f}\"")
+                l, t, w, h = shape.left, shape.top, shape.width, shape.height
+                out.append(f"   Position:")
+                out.append(f"      Left:   {l / EMU_PER_INCH:.2f}\"")
+                out.append(f"      Top:    {t / EMU_PER_INCH:.2f}\"")
+                out.append(f"      Width:  {w / EMU_PER_INCH:.2f}\"")
+                out.append(f"      Height: {h / EMU_PER_INCH:.2f}\"")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 # ============================================================================
 # STEP 2: HELPER FUNCTIONS FOR PRECISE POSITIONING
@@ -249,24 +298,23 @@ def create_custom_text_box(slide, text, left, top, width, height,
 # STEP 3: PRACTICAL EXAMPLES FOR YOUR TEMPLATE
 # ============================================================================
 
-def example_positioning_strategies(template_path):
+def example_positioning_strategies(prs):
     """
     Show different strategies for positioning with your template
     """
     
-    prs = Presentation(template_path)
-    
-    print("\n" + "=" * 80)
-    print("POSITIONING STRATEGIES FOR YOUR TEMPLATE")
-    print("=" * 80)
-    
-    # Strategy 1: Use placeholder dimensions
-    print("\n📋 STRATEGY 1: Fill placeholder area")
-    print("-" * 80)
-    print("Use when: You want chart to fit exactly in a placeholder")
-    print()
-    print("Code:")
-    print("""
+    lines = [
+        "\n" + "=" * 80,
+        "POSITIONING STRATEGIES FOR YOUR TEMPLATE",
+        "=" * 80,
+
+        # Strategy 1: Use placeholder dimensions
+        "\n📋 STRATEGY 1: Fill placeholder area",
+        "-" * 80,
+        "Use when: You want chart to fit exactly in a placeholder",
+        "",
+        "Code:",
+        """
 # Get placeholder dimensions
 placeholder = slide.placeholders[1]  # Content placeholder
 ph_left = placeholder.left.inches
@@ -285,15 +333,15 @@ slide.shapes.add_picture(
     Inches(ph_top),
     width=Inches(ph_width)  # Height auto-scales
 )
-    """)
-    
-    # Strategy 2: Below title
-    print("\n📋 STRATEGY 2: Position below title")
-    print("-" * 80)
-    print("Use when: Title at top, chart below")
-    print()
-    print("Code:")
-    print("""
+    """,
+
+        # Strategy 2: Below title
+        "\n📋 STRATEGY 2: Position below title",
+        "-" * 80,
+        "Use when: Title at top, chart below",
+        "",
+        "Code:",
+        """
 # Find where title ends
 title = slide.placeholders[0]
 title_bottom = title.top.inches + title.height.inches
@@ -309,19 +357,19 @@ slide.shapes.add_picture(
     Inches(chart_top),
     width=Inches(chart_width)
 )
-    """)
-    
-    # Strategy 3: Manual coordinates
-    print("\n📋 STRATEGY 3: Manual coordinates")
-    print("-" * 80)
-    print("Use when: You know exactly where you want it")
-    print()
-    print("Slide dimensions:")
-    print(f"   Width:  {prs.slide_width.inches:.2f}\"")
-    print(f"   Height: {prs.slide_height.inches:.2f}\"")
-    print()
-    print("Code:")
-    print("""
+    """,
+
+        # Strategy 3: Manual coordinates
+        "\n📋 STRATEGY 3: Manual coordinates",
+        "-" * 80,
+        "Use when: You know exactly where you want it",
+        "",
+        "Slide dimensions:",
+        f"   Width:  {prs.slide_width.inches:.2f}\"",
+        f"   Height: {prs.slide_height.inches:.2f}\"",
+        "",
+        "Code:",
+        """
 # Manual positioning (16:9 slide)
 slide.shapes.add_picture(
     chart_path,
@@ -341,15 +389,15 @@ slide.shapes.add_picture(
     Inches(2.0),
     width=Inches(chart_width)
 )
-    """)
-    
-    # Strategy 4: Grid-based
-    print("\n📋 STRATEGY 4: Grid-based layout")
-    print("-" * 80)
-    print("Use when: Multiple charts on one slide")
-    print()
-    print("Code:")
-    print("""
+    """,
+
+        # Strategy 4: Grid-based
+        "\n📋 STRATEGY 4: Grid-based layout",
+        "-" * 80,
+        "Use when: Multiple charts on one slide",
+        "",
+        "Code:",
+        """
 # 2x2 grid of charts
 margin = 0.5
 chart_width = (10 - 3*margin) / 2  # Two charts with margins
@@ -369,7 +417,9 @@ for idx, (left, top) in enumerate(positions):
         Inches(top),
         width=Inches(chart_width)
     )
-    """)
+    """,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ============================================================================
 # STEP 4: VISUAL COORDINATE SYSTEM
@@ -378,108 +428,129 @@ for idx, (left, top) in enumerate(positions):
 def show_coordinate_system():
     """Show PowerPoint coordinate system"""
     
-    print("\n" + "=" * 80)
-    print("POWERPOINT COORDINATE SYSTEM")
-    print("=" * 80)
-    print()
-    print("Standard 16:9 slide (10\" × 5.625\"):")
-    print()
-    print("  (0,0) ──────────────────────────── (10,0)")
-    print("    │                                    │")
-    print("    │         YOUR CONTENT               │")
-    print("    │                                    │")
-    print("    │                                    │")
-    print("  (0,5.625) ────────────────────── (10,5.625)")
-    print()
-    print("Common positions:")
-    print("  • Top-left corner:     (0, 0)")
-    print("  • Top-center:          (5, 0)")
-    print("  • Center:              (5, 2.8)")
-    print("  • Bottom-left:         (0, 5.625)")
-    print()
-    print("Safe content area (with 0.5\" margins):")
-    print("  • Left:   0.5\"")
-    print("  • Right:  9.5\"")
-    print("  • Top:    0.5\"")
-    print("  • Bottom: 5.125\"")
-    print()
-    print("Typical chart positions:")
-    print("  • Full-width chart:")
-    print("    left=1.0, top=1.5, width=8.0")
-    print()
-    print("  • Chart below title:")
-    print("    left=1.0, top=1.8, width=8.0")
-    print()
-    print("  • Side-by-side charts:")
-    print("    Chart 1: left=0.5, top=1.5, width=4.5")
-    print("    Chart 2: left=5.0, top=1.5, width=4.5")
+    lines = [
+        "\n" + "=" * 80,
+        "POWERPOINT COORDINATE SYSTEM",
+        "=" * 80,
+        "",
+        "Standard 16:9 slide (10\" × 5.625\"):",
+        "",
+        "  (0,0) ──────────────────────────── (10,0)",
+        "    │                                    │",
+        "    │         YOUR CONTENT               │",
+        "    │                                    │",
+        "    │                                    │",
+        "  (0,5.625) ────────────────────── (10,5.625)",
+        "",
+        "Common positions:",
+        "  • Top-left corner:     (0, 0)",
+        "  • Top-center:          (5, 0)",
+        "  • Center:              (5, 2.8)",
+        "  • Bottom-left:         (0, 5.625)",
+        "",
+        "Safe content area (with 0.5\" margins):",
+        "  • Left:   0.5\"",
+        "  • Right:  9.5\"",
+        "  • Top:    0.5\"",
+        "  • Bottom: 5.125\"",
+        "",
+        "Typical chart positions:",
+        "  • Full-width chart:",
+        "    left=1.0, top=1.5, width=8.0",
+        "",
+        "  • Chart below title:",
+        "    left=1.0, top=1.8, width=8.0",
+        "",
+        "  • Side-by-side charts:",
+        "    Chart 1: left=0.5, top=1.5, width=4.5",
+        "    Chart 2: left=5.0, top=1.5, width=4.5",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ============================================================================
 # STEP 5: DEBUGGING TOOL
 # ============================================================================
 
-def create_positioning_test_slide(template_path, output_path):
+# Grid overlay pieces for create_positioning_test_slide, emitted as raw XML
+# (same markup add_shape/add_textbox would produce) and grouped into one shape
+_GRID_LINE_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Grid Line {id}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="C8C8C8"/></a:solidFill></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+    '</p:sp>'
+)
+_GRID_LABEL_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Grid Label {id}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p><a:pPr><a:defRPr sz="1000"/></a:pPr><a:r><a:t>{text}</a:t></a:r></a:p></p:txBody>'
+    '</p:sp>'
+)
+
+def create_positioning_test_slide(prs, output_path):
     """
     Create a test slide showing grid overlay to help with positioning
     """
     
-    prs = Presentation(template_path)
-    
     # Add blank slide
     blank_layout = prs.slide_layouts[6]  # Usually blank
     slide = prs.slides.add_slide(blank_layout)
     
-    # Draw grid lines
-    slide_width = prs.slide_width.inches
-    slide_height = prs.slide_height.inches
-    
-    # Vertical lines every inch
-    for i in range(int(slide_width) + 1):
-        line = slide.shapes.add_shape(
-            1,  # Line
-            Inches(i), Inches(0),
-            Inches(0.01), Inches(slide_height)
-        )
-        line.fill.solid()
-        line.fill.fore_color.rgb = RGBColor(200, 200, 200)
-        
-        # Add label
-        label = slide.shapes.add_textbox(
-            Inches(i + 0.1), Inches(0.1),
-            Inches(0.5), Inches(0.3)
-        )
-        label.text_frame.text = f"{i}\""
-        label.text_frame.paragraphs[0].font.size = Pt(10)
-    
-    # Horizontal lines every inch
-    for i in range(int(slide_height) + 1):
-        line = slide.shapes.add_shape(
-            1,  # Line
-            Inches(0), Inches(i),
-            Inches(slide_width), Inches(0.01)
-        )
-        line.fill.solid()
-        line.fill.fore_color.rgb = RGBColor(200, 200, 200)
-        
-        # Add label
-        label = slide.shapes.add_textbox(
-            Inches(0.1), Inches(i + 0.1),
-            Inches(0.5), Inches(0.3)
-        )
-        label.text_frame.text = f"{i}\""
-        label.text_frame.paragraphs[0].font.size = Pt(10)
+    # Draw grid lines, with every size precomputed as integer EMU
+    w_emu, h_emu = prs.slide_width, prs.slide_height
+    thin = int(0.01 * EMU_PER_INCH)
+    gap = int(0.1 * EMU_PER_INCH)
+    lbl_w, lbl_h = int(0.5 * EMU_PER_INCH), int(0.3 * EMU_PER_INCH)
+    
+    group_id = slide.shapes._next_shape_id
+    ids = itertools.count(group_id + 1)
+    cols = range(w_emu // EMU_PER_INCH + 1)
+    rows = range(h_emu // EMU_PER_INCH + 1)
+    
+    # Lines every inch: all vertical, then all horizontal
+    v_lines = [_GRID_LINE_XML.format(id=next(ids), x=i * EMU_PER_INCH, y=0, cx=thin, cy=h_emu)
+               for i in cols]
+    h_lines = [_GRID_LINE_XML.format(id=next(ids), x=0, y=i * EMU_PER_INCH, cx=w_emu, cy=thin)
+               for i in rows]
+    
+    # Labels last, so every label sits above every line
+    labels = [_GRID_LABEL_XML.format(id=next(ids), x=i * EMU_PER_INCH + gap, y=gap,
+                                     cx=lbl_w, cy=lbl_h, text=f"{i}\"")
+              for i in cols]
+    labels += [_GRID_LABEL_XML.format(id=next(ids), x=gap, y=i * EMU_PER_INCH + gap,
+                                      cx=lbl_w, cy=lbl_h, text=f"{i}\"")
+               for i in rows]
+    
+    # Parse the whole grid as one group shape and append it in a single step
+    grid = parse_xml(
+        f'<p:grpSp {nsdecls("a", "p")}>'
+        f'<p:nvGrpSpPr><p:cNvPr id="{group_id}" name="Positioning Grid"/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+        f'<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{w_emu}" cy="{h_emu}"/>'
+        f'<a:chOff x="0" y="0"/><a:chExt cx="{w_emu}" cy="{h_emu}"/></a:xfrm></p:grpSpPr>'
+        + "".join(v_lines + h_lines + labels) +
+        '</p:grpSp>'
+    )
+    slide.shapes._spTree.insert_element_before(grid, 'p:extLst')
     
     # Add title
     title = slide.shapes.add_textbox(
-        Inches(1), Inches(2.5),
-        Inches(8), Inches(0.5)
+        EMU_PER_INCH, int(2.5 * EMU_PER_INCH),
+        8 * EMU_PER_INCH, EMU_PER_INCH // 2
     )
     title.text_frame.text = "Positioning Grid (1 inch squares)"
-    title.text_frame.paragraphs[0].font.size = Pt(24)
+    title.text_frame.paragraphs[0].font.size = _PT24
     title.text_frame.paragraphs[0].font.bold = True
     title.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     
-    prs.save(output_path)
+    with stored_images():
+        prs.save(output_path)
     print(f"\n✅ Test slide created: {output_path}")
     print("   Use this to visually measure positions in your template")
 
@@ -502,24 +573,35 @@ if __name__ == "__main__":
     # For Databricks, run all options
     print("Running all diagnostic tools...\n")
     
+    # Read the template once; each tool gets a Presentation parsed from memory
+    try:
+        with open(TEMPLATE_PATH, "rb") as f:
+            _tpl_bytes = f.read()
+    except FileNotFoundError:
+        _tpl_bytes = None
+    
+    def _load_prs():
+        return Presentation(BytesIO(_tpl_bytes))
+    
     # Option 1: Analyze template
-    if os.path.exists(TEMPLATE_PATH):
-        analyze_template(TEMPLATE_PATH)
+    if _tpl_bytes is not None:
+        prs = _load_prs()  # Read-only, shared by options 1 and 2
+        analyze_template(prs, TEMPLATE_PATH)
     else:
         print(f"❌ Template not found: {TEMPLATE_PATH}")
         print("   Please upload your template and update TEMPLATE_PATH")
     
     # Option 2: Show strategies
-    if os.path.exists(TEMPLATE_PATH):
-        example_positioning_strategies(TEMPLATE_PATH)
+    if _tpl_bytes is not None:
+        example_positioning_strategies(prs)
     
     # Option 3: Show coordinates
     show_coordinate_system()
     
-    # Option 4: Create test slide
-    if os.path.exists(TEMPLATE_PATH):
+    # Option 4: Create test slide (adds a slide, so it gets its own copy)
+    if _tpl_bytes is not None:
         test_output = "/dbfs/FileStore/presentations/positioning_test.pptx"
-        create_positioning_test_slide(TEMPLATE_PATH, test_output)
+        create_positioning_test_slide(_load_prs(), test_output)
     
     print("\n" + "=" * 80)
     print("DIAGNOSTIC COMPLETE")
@@ -9,9 +9,165 @@ Just copy the pattern that matches your template!
 
 from pptx import Presentation
 from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import namespaces
+from pptx.shapes.picture import Picture
+from pptx.shapes.placeholder import LayoutPlaceholder
+from lxml import etree
+import functools
+import inspect
 import os
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
+from operator import itemgetter
+
+EMU_PER_INCH = 914400
+_NS = namespaces("a", "p")
+
+_PT8, _PT12, _PT14, _PT18, _PT32 = Pt(8), Pt(12), Pt(14), Pt(18), Pt(32)
+
+# Embedded charts are PNG/JPEG, which are already deflate-compressed, but python-pptx
+# re-deflates every part on save. Inside stored_images(), images are written as-is
+# and XML uses a fast level; python-pptx's own writer is restored afterwards.
+try:
+    from pptx.opc.serialized import _ZipPkgWriter
+except ImportError:  # Private class; older python-pptx releases lay this out differently
+    _ZipPkgWriter = None
+
+# _zip_write relies on the writer's private _zipf and on write(pack_uri, blob);
+# on any other layout leave python-pptx's writer alone and save normally
+_CAN_STORE_IMAGES = (
+    _ZipPkgWriter is not None
+    and hasattr(_ZipPkgWriter, "_zipf")
+    and list(inspect.signature(_ZipPkgWriter.write).parameters) == ["self", "pack_uri", "blob"]
+)
+
+_STORED_EXTS = frozenset(("png", "jpg", "jpeg"))
+
+def _zip_write(self, pack_uri, blob):
+    """Write one package part, skipping recompression of images"""
+    if pack_uri.ext.lower() in _STORED_EXTS:
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+    else:
+        self._zipf.writestr(pack_uri.membername, blob, compresslevel=1)
+
+@contextmanager
+def stored_images():
+    """Use _zip_write for saves inside the block (plain save when it cannot be installed)"""
+    if not _CAN_STORE_IMAGES:
+        yield
+        return
+    original = _ZipPkgWriter.write
+    _ZipPkgWriter.write = _zip_write
+    try:
+        yield
+    finally:
+        _ZipPkgWriter.write = original
+
+# Per-slide progress lines; set PPTX_VERBOSE=0 for batch runs to skip them
+# (arguments are only formatted when the line is actually printed)
+_VERBOSE = os.environ.get("PPTX_VERBOSE", "1") == "1"
+
+def _log(msg, *args):
+    """Print a progress line when verbose output is on"""
+    if _VERBOSE:
+        print(msg.format(*args) if args else msg)
+
+# Patterns re-check the same chart files slide after slide, and each stat
+# on /dbfs is a FUSE round-trip - remember the answer per path for the run
+@functools.lru_cache(maxsize=256)
+def _chart_exists(path):
+    """Cached os.path.exists for chart files"""
+    return os.path.exists(path)
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path):
+    """os.makedirs(exist_ok=True), done once per directory per session"""
+    os.makedirs(path, exist_ok=True)
+
+# Same for the bytes: read each chart once and hand python-pptx a fresh stream
+_PNG_CACHE = {}
+
+def _open_png(path):
+    """BytesIO over a chart file, read from disk only on first use"""
+    blob = _PNG_CACHE.get(path)
+    if blob is None:
+        with open(path, "rb") as f:
+            blob = _PNG_CACHE[path] = f.read()
+    return BytesIO(blob)
+
+def _clear_file_caches():
+    """Forget cached chart lookups and bytes, so regenerated charts are picked up"""
+    _chart_exists.cache_clear()
+    _PNG_CACHE.clear()
+
+def _prefetch_chart(path):
+    """Check for a chart file and read its bytes into _PNG_CACHE"""
+    if _chart_exists(path):
+        _open_png(path)
+
+# add_picture() hashes the whole image to find an existing part on every call;
+# keep the part per chart and only add a slide relationship for repeat uses.
+# image_parts maps chart path -> image part and must belong to one Presentation.
+def _add_picture_cached(slide, path, left, top, width=None, height=None, image_parts=None):
+    """add_picture() that builds the image part once per chart file"""
+    if image_parts is None:
+        image_parts = {}
+    part = slide.part
+    image_part = image_parts.get(path)
+    if image_part is None:
+        image_part, _ = part.get_or_add_image_part(_open_png(path))
+        image_parts[path] = image_part
+    rId = part.relate_to(image_part, RT.IMAGE)
+    
+    shapes = slide.shapes
+    id_ = shapes._next_shape_id
+    cx, cy = image_part.scale(width, height)
+    pic = shapes._spTree.add_pic(id_, f"Picture {id_ - 1}", os.path.basename(path),
+                                 rId, left, top, cx, cy)
+    return Picture(pic, shapes)
+
+class _SlideGeom:
+    """Slide size in EMU, read once per Presentation"""
+    __slots__ = ("w_emu", "h_emu")
+    
+    def __init__(self, prs):
+        self.w_emu = prs.slide_width
+        self.h_emu = prs.slide_height
+
+def _drop(shape):
+    """Remove a shape's element from its parent tree"""
+    e = shape._element
+    e.getparent().remove(e)
+
+# Placeholder <p:sp> elements of a layout, their idx, and their own size if set
+_PH_SP = etree.XPath("./p:cSld/p:spTree/p:sp[p:nvSpPr/p:nvPr/p:ph]", namespaces=_NS)
+_PH_IDX = etree.XPath("string(./p:nvSpPr/p:nvPr/p:ph/@idx)", namespaces=_NS)
+_PH_EXT = etree.XPath("./p:spPr/a:xfrm/a:ext", namespaces=_NS)
+
+def _ph_area(sp, layout):
+    """Placeholder area in EMU², inherited from the master when the layout has no xfrm"""
+    ext = _PH_EXT(sp)
+    if ext:
+        return int(ext[0].get("cx")) * int(ext[0].get("cy"))
+    ph = LayoutPlaceholder(sp, layout)
+    return (ph.width or 0) * (ph.height or 0)
+
+def _add_title(slide, text, default_top=int(1.5 * EMU_PER_INCH)):
+    """Fill the title placeholder and return the chart top (EMU) just below it"""
+    try:
+        title = slide.placeholders[0]
+        title.text = text
+    except (KeyError, AttributeError):
+        return default_top
+    top, height = title.top, title.height
+    if top is None or height is None:  # No position inherited from layout or master
+        return default_top
+    return top + height + int(0.3 * EMU_PER_INCH)
 
 # ============================================================================
 # PATTERN 1: CHART FILLING A CONTENT PLACEHOLDER
@@ -19,21 +175,23 @@ import os
 # Use when: Your template has a "Title and Content" layout
 # The chart should fill the content area
 
-def pattern_1_fill_placeholder(prs, layout_idx, title_text, chart_path):
+def pattern_1_fill_placeholder(prs, layout, title_text, chart_path, image_parts=None):
     """Chart fills the content placeholder exactly"""
     
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    slide = prs.slides.add_slide(layout)
+    
+    # Walk the placeholders once; each placeholders[idx] lookup rescans them
+    phs = {ph.placeholder_format.idx: ph for ph in slide.placeholders}
     
     # Add title (usually placeholder 0)
     try:
-        title = slide.placeholders[0]
-        title.text = title_text
+        phs[0].text = title_text
     except:
         pass
     
     # Get content placeholder dimensions (usually placeholder 1)
     try:
-        content_ph = slide.placeholders[1]
+        content_ph = phs[1]
         
         # Get exact position and size
         left = content_ph.left.inches if content_ph.left > 0 else 0
@@ -42,23 +200,24 @@ def pattern_1_fill_placeholder(prs, layout_idx, title_text, chart_path):
         height = content_ph.height.inches
         
         # Remove placeholder so it doesn't show
-        sp = content_ph.element
-        sp.getparent().remove(sp)
+        _drop(content_ph)
         
         # Add chart in exact same space
-        if os.path.exists(chart_path):
-            slide.shapes.add_picture(
+        if _chart_exists(chart_path):
+            _add_picture_cached(
+                slide,
                 chart_path,
                 Inches(left),
                 Inches(top),
-                width=Inches(width)
+                width=Inches(width),
+                image_parts=image_parts
             )
-            print(f"   ✓ Pattern 1: Chart added to placeholder area")
+            _log("   ✓ Pattern 1: Chart added to placeholder area")
         
     except Exception as e:
         print(f"   ✗ Pattern 1 failed: {e}")
         # Fallback: use manual positioning
-        pattern_2_below_title(prs, layout_idx, title_text, chart_path)
+        pattern_2_below_title(prs, layout, title_text, chart_path, image_parts)
 
 # ============================================================================
 # PATTERN 2: CHART BELOW TITLE (MOST COMMON)
@@ -66,39 +225,27 @@ def pattern_1_fill_placeholder(prs, layout_idx, title_text, chart_path):
 # Use when: Simple layout with title at top, chart below
 # Works with most templates
 
-def pattern_2_below_title(prs, layout_idx, title_text, chart_path):
+def pattern_2_below_title(prs, layout, title_text, chart_path, image_parts=None):
     """Chart positioned below title with standard margins"""
     
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    slide = prs.slides.add_slide(layout)
     
-    # Add title
-    try:
-        title = slide.placeholders[0]
-        title.text = title_text
-        
-        # Find where title ends
-        title_bottom = title.top.inches + title.height.inches
-        
-        # Position chart below title
-        chart_left = 1.0      # 1 inch from left edge
-        chart_top = title_bottom + 0.3   # 0.3 inch below title
-        chart_width = 8.0     # 8 inches wide (fits in 10" slide with margins)
-        
-    except:
-        # If can't find title, use absolute position
-        chart_left = 1.0
-        chart_top = 1.5
-        chart_width = 8.0
+    # Add title; chart goes 0.3 inch below it (or 1.5 inch down without one)
+    chart_top = _add_title(slide, title_text)
+    chart_left = EMU_PER_INCH      # 1 inch from left edge
+    chart_width = 8 * EMU_PER_INCH     # 8 inches wide (fits in 10" slide with margins)
     
     # Add chart
-    if os.path.exists(chart_path):
-        slide.shapes.add_picture(
+    if _chart_exists(chart_path):
+        _add_picture_cached(
+            slide,
             chart_path,
-            Inches(chart_left),
-            Inches(chart_top),
-            width=Inches(chart_width)
+            chart_left,
+            chart_top,
+            width=chart_width,
+            image_parts=image_parts
         )
-        print(f"   ✓ Pattern 2: Chart positioned below title")
+        _log("   ✓ Pattern 2: Chart positioned below title")
     else:
         print(f"   ✗ Chart not found: {chart_path}")
 
@@ -107,10 +254,10 @@ def pattern_2_below_title(prs, layout_idx, title_text, chart_path):
 # ============================================================================
 # Use when: Using blank layout, want chart centered
 
-def pattern_3_centered(prs, layout_idx, title_text, chart_path):
+def pattern_3_centered(prs, layout, title_text, chart_path, geom=None, image_parts=None):
     """Chart centered on slide with title at top"""
     
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    slide = prs.slides.add_slide(layout)
     
     # Add title manually (since blank layout has no placeholders)
     title_box = slide.shapes.add_textbox(
@@ -118,87 +265,85 @@ def pattern_3_centered(prs, layout_idx, title_text, chart_path):
         Inches(9), Inches(0.6)
     )
     title_box.text_frame.text = title_text
-    title_box.text_frame.paragraphs[0].font.size = Pt(32)
+    title_box.text_frame.paragraphs[0].font.size = _PT32
     title_box.text_frame.paragraphs[0].font.bold = True
     title_box.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     
-    # Center the chart
-    chart_width = 8.0
-    chart_height = 4.0  # Approximate
-    
-    slide_width = prs.slide_width.inches
-    slide_height = prs.slide_height.inches
+    # Center the chart (EMU)
+    geom = geom or _SlideGeom(prs)
+    chart_width = 8 * EMU_PER_INCH
+    chart_height = 4 * EMU_PER_INCH  # Approximate
     
-    chart_left = (slide_width - chart_width) / 2
-    chart_top = (slide_height - chart_height) / 2 + 0.3  # Slightly below center
+    chart_left = (geom.w_emu - chart_width) // 2
+    chart_top = (geom.h_emu - chart_height) // 2 + int(0.3 * EMU_PER_INCH)  # Slightly below center
     
-    if os.path.exists(chart_path):
-        slide.shapes.add_picture(
+    if _chart_exists(chart_path):
+        _add_picture_cached(
+            slide,
             chart_path,
-            Inches(chart_left),
-            Inches(chart_top),
-            width=Inches(chart_width)
+            chart_left,
+            chart_top,
+            width=chart_width,
+            image_parts=image_parts
         )
-        print(f"   ✓ Pattern 3: Chart centered on slide")
+        _log("   ✓ Pattern 3: Chart centered on slide")
 
 # ============================================================================
 # PATTERN 4: TWO CHARTS SIDE BY SIDE
 # ============================================================================
 # Use when: Comparing two charts on one slide
 
-def pattern_4_side_by_side(prs, layout_idx, title_text, chart1_path, chart2_path):
+def pattern_4_side_by_side(prs, layout, title_text, chart1_path, chart2_path, image_parts=None):
     """Two charts side by side"""
     
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    slide = prs.slides.add_slide(layout)
     
     # Add title
-    try:
-        title = slide.placeholders[0]
-        title.text = title_text
-        title_bottom = title.top.inches + title.height.inches
-        chart_top = title_bottom + 0.3
-    except:
-        chart_top = 1.5
+    chart_top = _add_title(slide, title_text)
     
-    # Calculate positions for two charts
-    margin = 0.5
-    gap = 0.5
-    chart_width = (10 - 2*margin - gap) / 2  # Two charts with gap
+    # Calculate positions for two charts (EMU)
+    margin = EMU_PER_INCH // 2
+    gap = EMU_PER_INCH // 2
+    chart_width = (10 * EMU_PER_INCH - 2*margin - gap) // 2  # Two charts with gap
     
     # Chart 1 (left)
-    if os.path.exists(chart1_path):
-        slide.shapes.add_picture(
+    if _chart_exists(chart1_path):
+        _add_picture_cached(
+            slide,
             chart1_path,
-            Inches(margin),
-            Inches(chart_top),
-            width=Inches(chart_width)
+            margin,
+            chart_top,
+            width=chart_width,
+            image_parts=image_parts
         )
-        print(f"   ✓ Pattern 4: Left chart added")
+        _log("   ✓ Pattern 4: Left chart added")
     
     # Chart 2 (right)
-    if os.path.exists(chart2_path):
-        slide.shapes.add_picture(
+    if _chart_exists(chart2_path):
+        _add_picture_cached(
+            slide,
             chart2_path,
-            Inches(margin + chart_width + gap),
-            Inches(chart_top),
-            width=Inches(chart_width)
+            margin + chart_width + gap,
+            chart_top,
+            width=chart_width,
+            image_parts=image_parts
         )
-        print(f"   ✓ Pattern 4: Right chart added")
+        _log("   ✓ Pattern 4: Right chart added")
 
 # ============================================================================
 # PATTERN 5: CHART WITH CUSTOM TEXT BOXES
 # ============================================================================
 # Use when: You need text in specific positions around the chart
 
-def pattern_5_chart_with_annotations(prs, layout_idx, title_text, chart_path):
+def pattern_5_chart_with_annotations(prs, layout, title_text, chart_path, image_parts=None):
     """Chart with custom text annotations"""
     
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    slide = prs.slides.add_slide(layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
     title_box.text_frame.text = title_text
-    title_box.text_frame.paragraphs[0].font.size = Pt(32)
+    title_box.text_frame.paragraphs[0].font.size = _PT32
     title_box.text_frame.paragraphs[0].font.bold = True
     
     # Chart (left side)
@@ -206,12 +351,14 @@ def pattern_5_chart_with_annotations(prs, layout_idx, title_text, chart_path):
     chart_top = 1.2
     chart_width = 5.5
     
-    if os.path.exists(chart_path):
-        slide.shapes.add_picture(
+    if _chart_exists(chart_path):
+        _add_picture_cached(
+            slide,
             chart_path,
             Inches(chart_left),
             Inches(chart_top),
-            width=Inches(chart_width)
+            width=Inches(chart_width),
+            image_parts=image_parts
         )
     
     # Text box (right side)
@@ -227,9 +374,9 @@ def pattern_5_chart_with_annotations(prs, layout_idx, title_text, chart_path):
     # Add bullet points
     p = text_frame.paragraphs[0]
     p.text = "Key Insights:"
-    p.font.size = Pt(18)
+    p.font.size = _PT18
     p.font.bold = True
-    p.space_after = Pt(12)
+    p.space_after = _PT12
     
     insights = [
         "Growth of 15% year-over-year",
@@ -240,85 +387,78 @@ def pattern_5_chart_with_annotations(prs, layout_idx, title_text, chart_path):
     for insight in insights:
         p = text_frame.add_paragraph()
         p.text = f"• {insight}"
-        p.font.size = Pt(14)
-        p.space_after = Pt(8)
+        p.font.size = _PT14
+        p.space_after = _PT8
     
-    print(f"   ✓ Pattern 5: Chart with text annotations")
+    _log("   ✓ Pattern 5: Chart with text annotations")
 
 # ============================================================================
 # PATTERN 6: FULL-BLEED CHART (EDGE TO EDGE)
 # ============================================================================
 # Use when: You want chart to fill entire slide (presentation style)
 
-def pattern_6_full_bleed(prs, layout_idx, chart_path):
+def pattern_6_full_bleed(prs, layout, chart_path, geom=None, image_parts=None):
     """Chart fills entire slide edge-to-edge"""
     
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    slide = prs.slides.add_slide(layout)
     
     # Fill entire slide
-    slide_width = prs.slide_width.inches
-    slide_height = prs.slide_height.inches
-    
-    if os.path.exists(chart_path):
-        slide.shapes.add_picture(
+    geom = geom or _SlideGeom(prs)
+    if _chart_exists(chart_path):
+        _add_picture_cached(
+            slide,
             chart_path,
-            Inches(0),
-            Inches(0),
-            width=Inches(slide_width),
-            height=Inches(slide_height)
+            0,
+            0,
+            width=geom.w_emu,
+            height=geom.h_emu,
+            image_parts=image_parts
         )
-        print(f"   ✓ Pattern 6: Full-bleed chart")
+        _log("   ✓ Pattern 6: Full-bleed chart")
 
 # ============================================================================
 # PATTERN 7: FIND AND USE TEMPLATE PLACEHOLDERS AUTOMATICALLY
 # ============================================================================
 
-def pattern_7_auto_detect(prs, layout_idx, title_text, chart_path):
+def pattern_7_auto_detect(prs, layout, title_text, chart_path, image_parts=None):
     """Automatically detect content area and fill it"""
     
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
-    layout = prs.slide_layouts[layout_idx]
+    slide = prs.slides.add_slide(layout)
     
     # Add title to first placeholder
-    if len(slide.placeholders) > 0:
-        slide.placeholders[0].text = title_text
-    
-    # Find largest placeholder (usually content area)
-    largest_ph = None
-    largest_area = 0
-    
-    for ph in layout.placeholders:
-        if hasattr(ph, 'width') and hasattr(ph, 'height'):
-            area = ph.width * ph.height
-            if area > largest_area:
-                largest_area = area
-                largest_ph = ph
-    
-    if largest_ph and largest_ph != layout.placeholders[0]:
-        # Use the largest placeholder's area
-        left = largest_ph.left.inches if largest_ph.left > 0 else 1
-        top = largest_ph.top.inches if largest_ph.top > 0 else 1.5
-        width = largest_ph.width.inches
+    _add_title(slide, title_text)
+    
+    # Find largest placeholder (usually content area), reading sizes straight
+    # from the layout XML; only inherited sizes need the placeholder wrapper
+    areas = [(_ph_area(sp, layout), sp) for sp in _PH_SP(layout._element)]
+    largest_sp = max(areas, key=itemgetter(0))[1] if areas else None
+    
+    # Skip it if it is the title placeholder (idx 0, or no idx at all)
+    if largest_sp is not None and _PH_IDX(largest_sp) not in ("", "0"):
+        largest_ph = LayoutPlaceholder(largest_sp, layout)
+        
+        # Use the largest placeholder's area (EMU)
+        left = largest_ph.left if largest_ph.left > 0 else EMU_PER_INCH
+        top = largest_ph.top if largest_ph.top > 0 else int(1.5 * EMU_PER_INCH)
+        width = largest_ph.width
         
         # Remove placeholder
-        try:
-            sp = largest_ph.element
-            sp.getparent().remove(sp)
-        except:
-            pass
+        _drop(largest_ph)
         
         # Add chart
-        if os.path.exists(chart_path):
-            slide.shapes.add_picture(
+        if _chart_exists(chart_path):
+            _add_picture_cached(
+                slide,
                 chart_path,
-                Inches(left),
-                Inches(top),
-                width=Inches(width)
+                left,
+                top,
+                width=width,
+                image_parts=image_parts
             )
-            print(f"   ✓ Pattern 7: Auto-detected content area ({width:.1f}\" wide)")
+            _log("   ✓ Pattern 7: Auto-detected content area ({:.1f}\" wide)", width / EMU_PER_INCH)
     else:
         # Fallback to standard position
-        pattern_2_below_title(prs, layout_idx, title_text, chart_path)
+        pattern_2_below_title(prs, layout, title_text, chart_path, image_parts)
 
 # ============================================================================
 # USAGE EXAMPLES
@@ -332,53 +472,70 @@ def demonstrate_all_patterns():
     # Load your template
     TEMPLATE_PATH = "/dbfs/FileStore/templates/your_template.pptx"
     
-    if not os.path.exists(TEMPLATE_PATH):
-        print(f"❌ Template not found: {TEMPLATE_PATH}")
-        print("   Using blank presentation for demo")
-        prs = Presentation()
-    else:
-        prs = Presentation(TEMPLATE_PATH)
-        print(f"✅ Template loaded")
-    
     # Chart paths (from R script)
     chart1 = "/dbfs/FileStore/charts/sports_pie.png"
     chart2 = "/dbfs/FileStore/charts/device_lollipop.png"
     
+    # Charts may have been regenerated since the last run in this session
+    _clear_file_caches()
+    
+    # Slides all go into one Presentation, so they are built in order; the
+    # chart files are read from DBFS in the background while the template loads
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        prefetch = [pool.submit(_prefetch_chart, path) for path in (chart1, chart2)]
+        
+        if not os.path.exists(TEMPLATE_PATH):
+            print(f"❌ Template not found: {TEMPLATE_PATH}")
+            print("   Using blank presentation for demo")
+            prs = Presentation()
+        else:
+            prs = Presentation(TEMPLATE_PATH)
+            print(f"✅ Template loaded")
+        
+        for future in prefetch:
+            future.result()  # Surface read errors here rather than mid-slide
+    
     print("\nCreating example slides with different patterns...")
     print()
     
+    # Resolve the layouts once; each slide_layouts[i] lookup walks the XML
+    layouts = list(prs.slide_layouts)
+    geom = _SlideGeom(prs)
+    image_parts = {}  # Chart image parts for this deck only
+    
     # Pattern 1: Fill placeholder
-    if len(prs.slide_layouts) > 1:
-        pattern_1_fill_placeholder(prs, 1, "Pattern 1: Fill Placeholder", chart1)
+    if len(layouts) > 1:
+        pattern_1_fill_placeholder(prs, layouts[1], "Pattern 1: Fill Placeholder", chart1, image_parts)
     
     # Pattern 2: Below title (most common)
-    if len(prs.slide_layouts) > 1:
-        pattern_2_below_title(prs, 1, "Pattern 2: Below Title", chart1)
+    if len(layouts) > 1:
+        pattern_2_below_title(prs, layouts[1], "Pattern 2: Below Title", chart1, image_parts)
     
     # Pattern 3: Centered
-    if len(prs.slide_layouts) > 5:
-        pattern_3_centered(prs, 6, "Pattern 3: Centered", chart1)
+    if len(layouts) > 5:
+        pattern_3_centered(prs, layouts[6], "Pattern 3: Centered", chart1, geom, image_parts)
     
     # Pattern 4: Side by side
-    if len(prs.slide_layouts) > 1:
-        pattern_4_side_by_side(prs, 1, "Pattern 4: Side by Side", chart1, chart2)
+    if len(layouts) > 1:
+        pattern_4_side_by_side(prs, layouts[1], "Pattern 4: Side by Side", chart1, chart2, image_parts)
     
     # Pattern 5: With annotations
-    if len(prs.slide_layouts) > 5:
-        pattern_5_chart_with_annotations(prs, 6, "Pattern 5: With Annotations", chart1)
+    if len(layouts) > 5:
+        pattern_5_chart_with_annotations(prs, layouts[6], "Pattern 5: With Annotations", chart1, image_parts)
     
     # Pattern 6: Full bleed
-    if len(prs.slide_layouts) > 5:
-        pattern_6_full_bleed(prs, 6, chart1)
+    if len(layouts) > 5:
+        pattern_6_full_bleed(prs, layouts[6], chart1, geom, image_parts)
     
     # Pattern 7: Auto-detect
-    if len(prs.slide_layouts) > 1:
-        pattern_7_auto_detect(prs, 1, "Pattern 7: Auto-Detect", chart1)
+    if len(layouts) > 1:
+        pattern_7_auto_detect(prs, layouts[1], "Pattern 7: Auto-Detect", chart1, image_parts)
     
     # Save
     output_path = "/dbfs/FileStore/presentations/positioning_patterns_demo.pptx"
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    prs.save(output_path)
+    _ensure_dir(os.path.dirname(output_path))
+    with stored_images():
+        prs.save(output_path)
     
     print()
     print(f"✅ Demo presentation created: {output_path}")
@@ -391,74 +548,77 @@ def demonstrate_all_patterns():
 def print_quick_reference():
     """Print a quick reference for common positions"""
     
-    print("\n" + "=" * 80)
-    print("QUICK REFERENCE: Common Chart Positions (16:9 slide)")
-    print("=" * 80)
-    print()
-    
-    print("📍 STANDARD POSITIONS:")
-    print("-" * 80)
-    print()
-    
-    print("Full-width chart below title:")
-    print("  slide.shapes.add_picture(chart_path,")
-    print("                          Inches(1.0),    # left")
-    print("                          Inches(1.8),    # top")
-    print("                          width=Inches(8.0))")
-    print()
-    
-    print("Centered chart:")
-    print("  slide.shapes.add_picture(chart_path,")
-    print("                          Inches(1.0),    # left")
-    print("                          Inches(2.0),    # top")
-    print("                          width=Inches(8.0))")
-    print()
-    
-    print("Wide chart (maximum width with margins):")
-    print("  slide.shapes.add_picture(chart_path,")
-    print("                          Inches(0.5),    # left")
-    print("                          Inches(1.5),    # top")
-    print("                          width=Inches(9.0))")
-    print()
-    
-    print("Left half (for side-by-side):")
-    print("  slide.shapes.add_picture(chart_path,")
-    print("                          Inches(0.5),    # left")
-    print("                          Inches(1.5),    # top")
-    print("                          width=Inches(4.5))")
-    print()
-    
-    print("Right half (for side-by-side):")
-    print("  slide.shapes.add_picture(chart_path,")
-    print("                          Inches(5.0),    # left")
-    print("                          Inches(1.5),    # top")
-    print("                          width=Inches(4.5))")
-    print()
-    
-    print("📍 CALCULATING POSITIONS:")
-    print("-" * 80)
-    print()
-    
-    print("To center horizontally:")
-    print("  chart_width = 8.0")
-    print("  slide_width = 10.0  # Standard 16:9")
-    print("  left = (slide_width - chart_width) / 2  # = 1.0")
-    print()
-    
-    print("To position below title:")
-    print("  title = slide.placeholders[0]")
-    print("  title_bottom = title.top.inches + title.height.inches")
-    print("  chart_top = title_bottom + 0.3  # 0.3\" margin")
-    print()
-    
-    print("To use placeholder area:")
-    print("  content = slide.placeholders[1]")
-    print("  left = content.left.inches")
-    print("  top = content.top.inches")
-    print("  width = content.width.inches")
-    print()
-    
-    print("=" * 80)
+    lines = [
+        "\n" + "=" * 80,
+        "QUICK REFERENCE: Common Chart Positions (16:9 slide)",
+        "=" * 80,
+        "",
+
+        "📍 STANDARD POSITIONS:",
+        "-" * 80,
+        "",
+
+        "Full-width chart below title:",
+        "  slide.shapes.add_picture(chart_path,",
+        "                          Inches(1.0),    # left",
+        "                          Inches(1.8),    # top",
+        "                          width=Inches(8.0))",
+        "",
+
+        "Centered chart:",
+        "  slide.shapes.add_picture(chart_path,",
+        "                          Inches(1.0),    # left",
+        "                          Inches(2.0),    # top",
+        "                          width=Inches(8.0))",
+        "",
+
+        "Wide chart (maximum width with margins):",
+        "  slide.shapes.add_picture(chart_path,",
+        "                          Inches(0.5),    # left",
+        "                          Inches(1.5),    # top",
+        "                          width=Inches(9.0))",
+        "",
+
+        "Left half (for side-by-side):",
+        "  slide.shapes.add_picture(chart_path,",
+        "                          Inches(0.5),    # left",
+        "                          Inches(1.5),    # top",
+        "                          width=Inches(4.5))",
+        "",
+
+        "Right half (for side-by-side):",
+        "  slide.shapes.add_picture(chart_path,",
+        "                          Inches(5.0),    # left",
+        "                          Inches(1.5),    # top",
+        "                          width=Inches(4.5))",
+        "",
+
+        "📍 CALCULATING POSITIONS:",
+        "-" * 80,
+        "",
+
+        "To center horizontally:",
+        "  chart_width = 8.0",
+        "  slide_width = 10.0  # Standard 16:9",
+        "  left = (slide_width - chart_width) / 2  # = 1.0",
+        "",
+
+        "To position below title:",
+        "  title = slide.placeholders[0]",
+        "  title_bottom = title.top.inches + title.height.inches",
+        "  chart_top = title_bottom + 0.3  # 0.3\" margin",
+        "",
+
+        "To use placeholder area:",
+        "  content = slide.placeholders[1]",
+        "  left = content.left.inches",
+        "  top = content.top.inches",
+        "  width = content.width.inches",
+        "",
+
+        "=" * 80,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ============================================================================
 # RUN THE SCRIPT
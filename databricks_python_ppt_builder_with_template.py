@@ -10,13 +10,17 @@ Output: PowerPoint presentation in /dbfs/FileStore/presentations/
 ============================================================================
 """
 
-import pandas as pd
+import numpy as np
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.util import Inches, Length, Pt
+from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
-from datetime import datetime
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from copy import deepcopy
+from io import BytesIO
 import os
+import traceback
 
 print("=" * 80)
 print("SPORTS VIEWING ANALYTICS - POWERPOINT BUILDER (TEMPLATE MODE)")
@@ -73,91 +77,106 @@ except Exception as e:
 # ============================================================================
 print("2. Generating insights and recommendations...")
 
-def generate_key_findings(summary, monthly_data, sports_data, device_data):
+def format_summary(summary):
+    """Format the headline metrics once for both the findings and the slides"""
+    return {
+        'TotalViewingMinutes': f"{int(summary['TotalViewingMinutes']):,}",
+        'UniqueViewers': f"{int(summary['UniqueViewers']):,}",
+        'AvgMinutesPerViewer': f"{float(summary['AvgMinutesPerViewer']):.1f}",
+        'TotalAssets': f"{int(summary['TotalAssets']):,}",
+    }
+
+SPORTS_COLUMNS = ('Sport', 'ViewingMinutes', 'UniqueViewers', 'MinutesPerViewer')
+
+def sports_arrays(sports_data):
+    """NumPy arrays for the sports columns, shared by the insights and the table"""
+    return {c: sports_data[c].to_numpy() for c in SPORTS_COLUMNS}
+
+def generate_key_findings(summary, monthly_data, sports_data, device_data, summary_text=None,
+                          sports_np=None):
     """Generate key findings from the data"""
-    findings = []
-    
-    findings.append(
-        f"Total viewing time reached {int(summary['TotalViewingMinutes']):,} minutes "
-        f"across {int(summary['UniqueViewers']):,} unique viewers"
-    )
-    
-    top_comp = monthly_data.groupby('Competition')['ViewingMinutes'].sum().idxmax()
-    top_comp_views = int(monthly_data.groupby('Competition')['ViewingMinutes'].sum().max())
-    findings.append(
-        f"{top_comp} led all competitions with {top_comp_views:,} total viewing minutes"
-    )
-    
-    avg_engagement = summary['AvgMinutesPerViewer']
-    findings.append(
-        f"Average viewer engagement of {avg_engagement:.1f} minutes per viewer "
-        f"indicates strong content retention"
-    )
-    
-    top_sport = sports_data.nlargest(1, 'ViewingMinutes')['Sport'].values[0]
-    findings.append(f"{top_sport} dominated sports viewership across all categories")
-    
-    top_device = device_data.nlargest(1, 'UniqueViewers')['Device'].values[0]
-    findings.append(
-        f"{top_device} was the preferred viewing device, capturing the largest audience share"
-    )
-    
-    monthly_totals = monthly_data.groupby('YearMonth')['ViewingMinutes'].sum()
-    first_half = monthly_totals.iloc[:6].mean()
-    second_half = monthly_totals.iloc[6:].mean()
+    summary_text = summary_text or format_summary(summary)
+    sports_np = sports_np or sports_arrays(sports_data)
+    
+    comp_minutes = monthly_data.groupby('Competition', sort=False, observed=True)['ViewingMinutes'].sum()
+    top_comp = comp_minutes.idxmax()
+    top_comp_views = int(comp_minutes.max())
+    
+    top_sport = sports_np['Sport'][sports_np['ViewingMinutes'].argmax()]
+    top_device = device_data['Device'].iat[device_data['UniqueViewers'].to_numpy().argmax()]
+    
+    # Keep the key sort here: the half-year split below relies on month order
+    monthly_totals = monthly_data.groupby('YearMonth', observed=True)['ViewingMinutes'].sum()
+    month_totals = monthly_totals.to_numpy()
+    first_half = month_totals[:6].mean()
+    second_half = month_totals[6:].mean()
     growth = ((second_half - first_half) / first_half) * 100
-    findings.append(
+    
+    findings = [
+        f"Total viewing time reached {summary_text['TotalViewingMinutes']} minutes "
+        f"across {summary_text['UniqueViewers']} unique viewers",
+        
+        f"{top_comp} led all competitions with {top_comp_views:,} total viewing minutes",
+        
+        f"Average viewer engagement of {summary_text['AvgMinutesPerViewer']} minutes per viewer "
+        f"indicates strong content retention",
+        
+        f"{top_sport} dominated sports viewership across all categories",
+        
+        f"{top_device} was the preferred viewing device, capturing the largest audience share",
+        
         f"Viewing minutes {'increased' if growth > 0 else 'decreased'} by "
-        f"{abs(growth):.1f}% in the second half of the year"
-    )
+        f"{abs(growth):.1f}% in the second half of the year",
+    ]
     
     return findings
 
-def generate_recommendations(monthly_data, sports_data, device_data):
+def generate_recommendations(monthly_data, sports_data, device_data, sports_np=None):
     """Generate strategic recommendations"""
-    recommendations = []
+    sports_np = sports_np or sports_arrays(sports_data)
     
-    top_3_comps = monthly_data.groupby('Competition')['UniqueViewers'].sum().nlargest(3).index.tolist()
-    recommendations.append(
-        f"Focus marketing efforts on top-performing competitions: {', '.join(top_3_comps)}"
-    )
+    comp_viewers = monthly_data.groupby('Competition', sort=False, observed=True)['UniqueViewers'].sum()
+    top_3_comps = comp_viewers.nlargest(3).index.tolist()
     
-    mobile_users = device_data[device_data['Device'] == 'Mobile']['UniqueViewers'].values
-    tv_users = device_data[device_data['Device'] == 'TV']['UniqueViewers'].values
+    # One pass over the device table, then plain dict lookups
+    device_viewers = dict(zip(device_data['Device'], device_data['UniqueViewers']))
+    mobile_users = device_viewers.get('Mobile')
+    tv_users = device_viewers.get('TV')
     
-    if len(mobile_users) > 0 and len(tv_users) > 0:
-        if mobile_users[0] > tv_users[0]:
-            recommendations.append(
-                "Prioritize mobile app enhancements and responsive design given strong mobile adoption"
-            )
+    device_rec = None
+    if mobile_users is not None and tv_users is not None:
+        if mobile_users > tv_users:
+            device_rec = "Prioritize mobile app enhancements and responsive design given strong mobile adoption"
         else:
-            recommendations.append(
-                "Optimize TV viewing experience with enhanced picture quality and interactive features"
-            )
-    
-    low_engagement_sports = sports_data.nsmallest(2, 'MinutesPerViewer')['Sport'].tolist()
-    if len(low_engagement_sports) >= 2:
-        recommendations.append(
+            device_rec = "Optimize TV viewing experience with enhanced picture quality and interactive features"
+    
+    # Two lowest-engagement sports, lowest first, without sorting the whole column
+    engagement_rec = None
+    minutes_per_viewer = sports_np['MinutesPerViewer']
+    if len(minutes_per_viewer) >= 2:
+        lowest = np.argpartition(minutes_per_viewer, 1)[:2]
+        low_engagement_sports = sports_np['Sport'][lowest].tolist()
+        engagement_rec = (
             f"Improve content quality and promotion for {' and '.join(low_engagement_sports)} "
             f"to boost engagement"
         )
     
-    recommendations.append(
-        "Develop targeted campaigns for Q4 when football competitions peak in viewership"
-    )
-    
-    recommendations.append(
-        "Implement seamless cross-device experiences to support viewers who switch between TV and mobile"
-    )
-    
-    recommendations.append(
-        "Launch loyalty programs to convert casual viewers into regular subscribers"
-    )
+    # The device and engagement items depend on the data, so skip them when not computed
+    recommendations = [rec for rec in (
+        f"Focus marketing efforts on top-performing competitions: {', '.join(top_3_comps)}",
+        device_rec,
+        engagement_rec,
+        "Develop targeted campaigns for Q4 when football competitions peak in viewership",
+        "Implement seamless cross-device experiences to support viewers who switch between TV and mobile",
+        "Launch loyalty programs to convert casual viewers into regular subscribers",
+    ) if rec is not None]
     
     return recommendations
 
-findings = generate_key_findings(summary, monthly_data, sports_data, device_data)
-recommendations = generate_recommendations(monthly_data, sports_data, device_data)
+summary_text = format_summary(summary)
+sports_np = sports_arrays(sports_data)
+findings = generate_key_findings(summary, monthly_data, sports_data, device_data, summary_text, sports_np)
+recommendations = generate_recommendations(monthly_data, sports_data, device_data, sports_np)
 
 print("   ✓ Generated", len(findings), "key findings")
 print("   ✓ Generated", len(recommendations), "strategic recommendations")
@@ -167,6 +186,10 @@ print()
 # SECTION 3: HELPER FUNCTIONS FOR TEMPLATE HANDLING
 # ============================================================================
 
+# Font sizes used in this deck, built once
+_PT12, _PT14, _PT16, _PT18, _PT20 = Pt(12), Pt(14), Pt(16), Pt(18), Pt(20)
+_PT24, _PT32, _PT36, _PT44, _PT56 = Pt(24), Pt(32), Pt(36), Pt(44), Pt(56)
+
 def get_slide_layout_info(prs):
     """Display information about available slide layouts in the template"""
     print("\n   📋 Available Slide Layouts in Template:")
@@ -177,32 +200,47 @@ def get_slide_layout_info(prs):
             print(f"           [{pidx}] {placeholder.name} ({placeholder.placeholder_format.type})")
     print()
 
-def add_content_to_placeholder(slide, placeholder_idx, content, font_size=16, bold=False, color=None):
-    """Add text content to a specific placeholder"""
+def add_content_to_placeholder(slide, placeholder_idx, content, font_size=_PT16, bold=False, color=None):
+    """Add text content to a specific placeholder (font_size in points or as a Length)"""
+    if not isinstance(font_size, Length):
+        font_size = Pt(font_size)
     try:
         placeholder = slide.placeholders[placeholder_idx]
         text_frame = placeholder.text_frame
-        text_frame.clear()
-        text_frame.text = content
+        text_frame.text = content  # Replaces every existing paragraph
         
+        # One paragraph per line of content (the metrics text has several)
         for paragraph in text_frame.paragraphs:
-            paragraph.font.size = Pt(font_size)
+            font = paragraph.font
+            font.size = font_size
             if bold:
-                paragraph.font.bold = True
+                font.bold = True
             if color:
-                paragraph.font.color.rgb = color
+                font.color.rgb = color
         
         return True
     except (KeyError, IndexError):
         print(f"      Warning: Placeholder {placeholder_idx} not found")
         return False
 
-def add_bullet_points_to_placeholder(slide, placeholder_idx, items, font_size=16):
-    """Add bullet points to a placeholder"""
+def add_bullet_points_to_placeholder(slide, placeholder_idx, items, font_size=_PT16):
+    """Add bullet points to a placeholder (font_size in points or as a Length)"""
+    if not isinstance(font_size, Length):
+        font_size = Pt(font_size)
     try:
         placeholder = slide.placeholders[placeholder_idx]
         text_frame = placeholder.text_frame
-        text_frame.clear()
+        # Fresh placeholders hold a single empty paragraph; nothing to clear then
+        paragraphs = text_frame.paragraphs
+        if len(paragraphs) > 1 or paragraphs[0].text:
+            text_frame.clear()
+        
+        # Paragraph formatting (level 0, 12pt after, font size) built once as XML
+        # and copied into each bullet, rather than three property setters per bullet
+        ppr = parse_xml(
+            f'<a:pPr {nsdecls("a")}><a:spcAft><a:spcPts val="1200"/></a:spcAft>'
+            f'<a:defRPr sz="{font_size.centipoints}"/></a:pPr>'
+        )
         
         for idx, item in enumerate(items):
             if idx == 0:
@@ -211,37 +249,70 @@ def add_bullet_points_to_placeholder(slide, placeholder_idx, items, font_size=16
                 p = text_frame.add_paragraph()
             
             p.text = item
-            p.level = 0
-            p.font.size = Pt(font_size)
-            p.space_after = Pt(12)
+            if p._p.pPr is None:
+                p._p.insert(0, deepcopy(ppr))
+            else:
+                # Keep formatting the template already put on this paragraph
+                p.level = 0
+                p.font.size = font_size
+                p.space_after = _PT12
         
         return True
     except (KeyError, IndexError):
         print(f"      Warning: Placeholder {placeholder_idx} not found")
         return False
 
+# Image bytes by path, so each chart is read from DBFS once
+_image_cache = {}
+
+def _load_image(image_path):
+    """Image bytes for a path (read once, then cached), or None if it is missing"""
+    blob = _image_cache.get(image_path)
+    if blob is None:
+        try:
+            with open(image_path, 'rb') as f:
+                blob = _image_cache[image_path] = f.read()
+        except FileNotFoundError:
+            return None
+    return blob
+
 def add_image_to_slide(slide, image_path, left, top, width=None, height=None):
     """Add image to slide at specified position"""
-    if os.path.exists(image_path):
-        if width and height:
-            slide.shapes.add_picture(image_path, Inches(left), Inches(top), 
-                                    width=Inches(width), height=Inches(height))
-        elif width:
-            slide.shapes.add_picture(image_path, Inches(left), Inches(top), width=Inches(width))
-        else:
-            slide.shapes.add_picture(image_path, Inches(left), Inches(top))
-        return True
-    else:
+    blob = _load_image(image_path)
+    if blob is None:
         print(f"      Warning: Image not found: {image_path}")
         return False
+    
+    image = BytesIO(blob)
+    if width and height:
+        pic = slide.shapes.add_picture(image, Inches(left), Inches(top), 
+                                       width=Inches(width), height=Inches(height))
+    elif width:
+        pic = slide.shapes.add_picture(image, Inches(left), Inches(top), width=Inches(width))
+    else:
+        pic = slide.shapes.add_picture(image, Inches(left), Inches(top))
+    
+    # A stream has no file name; keep the chart's file name as the alt text
+    pic._element.nvPicPr.cNvPr.set('descr', os.path.basename(image_path))
+    return True
 
 # ============================================================================
 # SECTION 4: CREATE POWERPOINT PRESENTATION
 # ============================================================================
 print("3. Creating PowerPoint presentation...")
 
-def create_presentation_with_template(summary, sports_data, device_data, findings, recommendations):
+# Output directories already created this session (each makedirs is a DBFS round-trip)
+_dirs_ensured = set()
+
+# "1. " .. "50. " for numbering recommendations (generate_recommendations returns 6;
+# longer lists are numbered inline past the table)
+_PREFIXES = tuple(f"{i}. " for i in range(1, 51))
+
+def create_presentation_with_template(summary, sports_data, device_data, findings, recommendations,
+                                      summary_text=None, sports_np=None):
     """Create the PowerPoint presentation using template"""
+    summary_text = summary_text or format_summary(summary)
+    sports_np = sports_np or sports_arrays(sports_data)
     
     # Load template or create blank presentation
     if USE_TEMPLATE:
@@ -277,11 +348,14 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
             print(f"      Warning: Layout {index} not found, using layout {fallback}")
             return prs.slide_layouts[fallback]
     
+    # Resolve each layout once instead of indexing slide_layouts per slide
+    layouts = {i: get_layout(i) for i in (LAYOUT_TITLE, LAYOUT_TITLE_CONTENT, LAYOUT_TITLE_ONLY)}
+    
     # ========================================================================
     # SLIDE 1: TITLE SLIDE (Using Template Layout)
     # ========================================================================
     print("      - Slide 1: Title")
-    slide1 = prs.slides.add_slide(get_layout(LAYOUT_TITLE))
+    slide1 = prs.slides.add_slide(layouts[LAYOUT_TITLE])
     
     # Method 1: Use template placeholders (PREFERRED)
     # Find title and subtitle placeholders
@@ -289,16 +363,16 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
         # Common placeholder indices for title slides
         # Title is usually placeholder 0, subtitle is usually placeholder 1
         add_content_to_placeholder(slide1, 0, "SPORTS VIEWING ANALYTICS REPORT 2025", 
-                                  font_size=44, bold=True)
+                                  font_size=_PT44, bold=True)
         add_content_to_placeholder(slide1, 1, 
                                   "Comprehensive Analysis of Viewing Trends, Engagement & Recommendations",
-                                  font_size=18)
+                                  font_size=_PT18)
     except:
         # Method 2: Add text manually if placeholders don't work
         title_box = slide1.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1))
         title_frame = title_box.text_frame
         title_frame.text = "SPORTS VIEWING ANALYTICS REPORT 2025"
-        title_frame.paragraphs[0].font.size = Pt(44)
+        title_frame.paragraphs[0].font.size = _PT44
         title_frame.paragraphs[0].font.bold = True
         title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     
@@ -306,39 +380,39 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
     # SLIDE 2: EXECUTIVE SUMMARY
     # ========================================================================
     print("      - Slide 2: Executive Summary")
-    slide2 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_CONTENT))
+    slide2 = prs.slides.add_slide(layouts[LAYOUT_TITLE_CONTENT])
     
-    add_content_to_placeholder(slide2, 0, "EXECUTIVE SUMMARY", font_size=36, bold=True)
+    add_content_to_placeholder(slide2, 0, "EXECUTIVE SUMMARY", font_size=_PT36, bold=True)
     
     # Create metrics text
     metrics_text = f"""
-📊 Total Viewing Minutes: {int(summary['TotalViewingMinutes']):,}
+📊 Total Viewing Minutes: {summary_text['TotalViewingMinutes']}
 
-👥 Unique Viewers: {int(summary['UniqueViewers']):,}
+👥 Unique Viewers: {summary_text['UniqueViewers']}
 
-⏱️ Average Minutes per Viewer: {summary['AvgMinutesPerViewer']:.1f}
+⏱️ Average Minutes per Viewer: {summary_text['AvgMinutesPerViewer']}
 
-🎬 Total Assets: {int(summary['TotalAssets']):,}
+🎬 Total Assets: {summary_text['TotalAssets']}
     """.strip()
     
-    add_content_to_placeholder(slide2, 1, metrics_text, font_size=20)
+    add_content_to_placeholder(slide2, 1, metrics_text, font_size=_PT20)
     
     # ========================================================================
     # SLIDE 3: KEY FINDINGS
     # ========================================================================
     print("      - Slide 3: Key Findings")
-    slide3 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_CONTENT))
+    slide3 = prs.slides.add_slide(layouts[LAYOUT_TITLE_CONTENT])
     
-    add_content_to_placeholder(slide3, 0, "KEY FINDINGS", font_size=36, bold=True)
-    add_bullet_points_to_placeholder(slide3, 1, findings, font_size=16)
+    add_content_to_placeholder(slide3, 0, "KEY FINDINGS", font_size=_PT36, bold=True)
+    add_bullet_points_to_placeholder(slide3, 1, findings, font_size=_PT16)
     
     # ========================================================================
     # SLIDE 4: SPORTS DISTRIBUTION CHART
     # ========================================================================
     print("      - Slide 4: Sports Distribution Chart")
-    slide4 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_ONLY))
+    slide4 = prs.slides.add_slide(layouts[LAYOUT_TITLE_ONLY])
     
-    add_content_to_placeholder(slide4, 0, "VIEWERSHIP BY SPORT", font_size=36, bold=True)
+    add_content_to_placeholder(slide4, 0, "VIEWERSHIP BY SPORT", font_size=_PT36, bold=True)
     add_image_to_slide(slide4, "/dbfs/FileStore/charts/sports_pie.png", 
                       left=1, top=1.5, width=8)
     
@@ -346,9 +420,9 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
     # SLIDE 5: DEVICE VIEWERSHIP CHART
     # ========================================================================
     print("      - Slide 5: Device Viewership Chart")
-    slide5 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_ONLY))
+    slide5 = prs.slides.add_slide(layouts[LAYOUT_TITLE_ONLY])
     
-    add_content_to_placeholder(slide5, 0, "VIEWERSHIP BY DEVICE", font_size=36, bold=True)
+    add_content_to_placeholder(slide5, 0, "VIEWERSHIP BY DEVICE", font_size=_PT36, bold=True)
     add_image_to_slide(slide5, "/dbfs/FileStore/charts/device_lollipop.png", 
                       left=1, top=1.5, width=8)
     
@@ -356,10 +430,10 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
     # SLIDE 6: COMPETITION TRENDS CHART
     # ========================================================================
     print("      - Slide 6: Competition Trends Chart")
-    slide6 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_ONLY))
+    slide6 = prs.slides.add_slide(layouts[LAYOUT_TITLE_ONLY])
     
     add_content_to_placeholder(slide6, 0, "COMPETITION TRENDS OVER TIME", 
-                              font_size=32, bold=True)
+                              font_size=_PT32, bold=True)
     add_image_to_slide(slide6, "/dbfs/FileStore/charts/competition_line.png", 
                       left=0.5, top=1.5, width=9)
     
@@ -367,31 +441,33 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
     # SLIDE 7: TOP COMPETITIONS CHART
     # ========================================================================
     print("      - Slide 7: Top Competitions Chart")
-    slide7 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_ONLY))
+    slide7 = prs.slides.add_slide(layouts[LAYOUT_TITLE_ONLY])
     
     add_content_to_placeholder(slide7, 0, "TOP PERFORMING COMPETITIONS", 
-                              font_size=36, bold=True)
+                              font_size=_PT36, bold=True)
     add_image_to_slide(slide7, "/dbfs/FileStore/charts/competition_bar.png", 
                       left=1, top=1.5, width=8)
     
     # ========================================================================
     # SLIDE 8: GT/FLEXTABLE (if available)
     # ========================================================================
-    if os.path.exists("/dbfs/FileStore/charts/sports_gt_table.png"):
+    # Loading the image doubles as the existence check; add_image_to_slide
+    # then takes the bytes from the cache instead of reopening the file
+    gt_table_path = "/dbfs/FileStore/charts/sports_gt_table.png"
+    if _load_image(gt_table_path) is not None:
         print("      - Slide 8: Sports Performance Table")
-        slide8 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_ONLY))
+        slide8 = prs.slides.add_slide(layouts[LAYOUT_TITLE_ONLY])
         
         add_content_to_placeholder(slide8, 0, "DETAILED SPORTS METRICS", 
-                                  font_size=36, bold=True)
-        add_image_to_slide(slide8, "/dbfs/FileStore/charts/sports_gt_table.png", 
-                          left=0.5, top=1.5, width=9)
+                                  font_size=_PT36, bold=True)
+        add_image_to_slide(slide8, gt_table_path, left=0.5, top=1.5, width=9)
     else:
         # Fallback: Create table using python-pptx if GT table image doesn't exist
         print("      - Slide 8: Sports Metrics Table (python-pptx)")
-        slide8 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_CONTENT))
+        slide8 = prs.slides.add_slide(layouts[LAYOUT_TITLE_CONTENT])
         
         add_content_to_placeholder(slide8, 0, "DETAILED SPORTS METRICS", 
-                                  font_size=36, bold=True)
+                                  font_size=_PT36, bold=True)
         
         # Create table in placeholder or manually
         try:
@@ -420,50 +496,51 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
             cell.text = header
             for paragraph in cell.text_frame.paragraphs:
                 paragraph.font.bold = True
-                paragraph.font.size = Pt(14)
+                paragraph.font.size = _PT14
                 paragraph.alignment = PP_ALIGN.CENTER
         
-        # Data
-        for row_idx, (_, row) in enumerate(sports_data.iterrows(), start=1):
-            table.cell(row_idx, 0).text = str(row['Sport'])
-            table.cell(row_idx, 1).text = f"{int(row['ViewingMinutes']):,}"
-            table.cell(row_idx, 2).text = f"{int(row['UniqueViewers']):,}"
-            table.cell(row_idx, 3).text = f"{row['MinutesPerViewer']:.2f}"
+        # Data (zipped column arrays instead of a Series per row from iterrows)
+        rows_arr = zip(*(sports_np[c] for c in SPORTS_COLUMNS))
+        for row_idx, (sport, minutes, viewers, per_viewer) in enumerate(rows_arr, start=1):
+            texts = (str(sport), f"{int(minutes):,}", f"{int(viewers):,}", f"{per_viewer:.2f}")
             
-            for col_idx in range(4):
+            for col_idx, text in enumerate(texts):
                 cell = table.cell(row_idx, col_idx)
-                for paragraph in cell.text_frame.paragraphs:
-                    paragraph.font.size = Pt(12)
-                    paragraph.alignment = PP_ALIGN.CENTER
+                cell.text = text
+                # Setting .text leaves exactly one paragraph
+                paragraph = cell.text_frame.paragraphs[0]
+                paragraph.font.size = _PT12
+                paragraph.alignment = PP_ALIGN.CENTER
     
     # ========================================================================
     # SLIDE 9: RECOMMENDATIONS
     # ========================================================================
     print("      - Slide 9: Strategic Recommendations")
-    slide9 = prs.slides.add_slide(get_layout(LAYOUT_TITLE_CONTENT))
+    slide9 = prs.slides.add_slide(layouts[LAYOUT_TITLE_CONTENT])
     
     add_content_to_placeholder(slide9, 0, "STRATEGIC RECOMMENDATIONS", 
-                              font_size=36, bold=True)
+                              font_size=_PT36, bold=True)
     
     # Format recommendations with numbers
-    numbered_recs = [f"{i+1}. {rec}" for i, rec in enumerate(recommendations)]
-    add_bullet_points_to_placeholder(slide9, 1, numbered_recs, font_size=16)
+    numbered_recs = [(_PREFIXES[i] if i < len(_PREFIXES) else f"{i + 1}. ") + rec
+                     for i, rec in enumerate(recommendations)]
+    add_bullet_points_to_placeholder(slide9, 1, numbered_recs, font_size=_PT16)
     
     # ========================================================================
     # SLIDE 10: CLOSING SLIDE (Using Template)
     # ========================================================================
     print("      - Slide 10: Closing")
-    slide10 = prs.slides.add_slide(get_layout(LAYOUT_TITLE))
+    slide10 = prs.slides.add_slide(layouts[LAYOUT_TITLE])
     
     try:
-        add_content_to_placeholder(slide10, 0, "THANK YOU", font_size=56, bold=True)
-        add_content_to_placeholder(slide10, 1, "Questions & Discussion", font_size=24)
+        add_content_to_placeholder(slide10, 0, "THANK YOU", font_size=_PT56, bold=True)
+        add_content_to_placeholder(slide10, 1, "Questions & Discussion", font_size=_PT24)
     except:
         # Manual fallback
         title_box = slide10.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(1))
         title_frame = title_box.text_frame
         title_frame.text = "THANK YOU"
-        title_frame.paragraphs[0].font.size = Pt(56)
+        title_frame.paragraphs[0].font.size = _PT56
         title_frame.paragraphs[0].font.bold = True
         title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     
@@ -472,8 +549,11 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
     # ========================================================================
     print("   Saving presentation...")
     
-    os.makedirs('/dbfs/FileStore/presentations', exist_ok=True)
-    output_path = '/dbfs/FileStore/presentations/Sports_Viewing_Analytics_Report_2025.pptx'
+    output_dir = '/dbfs/FileStore/presentations'
+    if output_dir not in _dirs_ensured:
+        os.makedirs(output_dir, exist_ok=True)
+        _dirs_ensured.add(output_dir)
+    output_path = output_dir + '/Sports_Viewing_Analytics_Report_2025.pptx'
     prs.save(output_path)
     
     return output_path
@@ -481,12 +561,11 @@ def create_presentation_with_template(summary, sports_data, device_data, finding
 # Create the presentation
 try:
     output_file = create_presentation_with_template(summary, sports_data, device_data, 
-                                                    findings, recommendations)
+                                                    findings, recommendations, summary_text, sports_np)
     print("   ✓ Presentation saved successfully")
     print()
 except Exception as e:
     print(f"   ✗ Error creating presentation: {e}")
-    import traceback
     traceback.print_exc()
     raise
 
@@ -501,7 +580,7 @@ print("✅ Presentation Details:")
 print(f"   - Template Used: {'Yes' if USE_TEMPLATE else 'No (blank slides)'}")
 print(f"   - Total Slides: 10")
 print(f"   - File Location: {output_file}")
-print(f"   - File Size: {os.path.getsize(output_file) / 1024:.1f} KB")
+print(f"   - File Size: {os.stat(output_file).st_size / 1024:.1f} KB")
 print()
 print("📊 Content Summary:")
 print(f"   - 1 Title slide")